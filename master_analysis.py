@@ -6,105 +6,410 @@ Runs all three algorithms and creates comprehensive scoring
 
 import json
 import csv
-from substance_detector import SubstanceDetector
-from quality_assessor import QualityAssessor
-from uniqueness_detector import UniquenessDetector
+import heapq
+import itertools
+import mmap
+import os
+import sys
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from scipy.sparse import csr_matrix
+from substance import SubstanceDetector
+from quality import QualityAssessor
+from uniqueness import UniquenessDetector
 
-def analyze_all_content(json_file_path):
-    """Run all three algorithms and combine results"""
+try:
+    from tqdm import tqdm  # Optional: progress bar while posts are analyzed
+except ImportError:
+    def tqdm(iterable, **kwargs):
+        """Stand-in when tqdm isn't installed: no progress bar, just the items"""
+        return iterable
+
+try:
+    import orjson  # Optional: much faster JSON parser for large scrapes
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: streams posts one at a time instead of loading the whole file
+except ImportError:
+    ijson = None
+
+# Composite score weights for (substance, quality, uniqueness)
+DEFAULT_WEIGHTS = np.array([
+    0.35,  # 35% weight: substance
+    0.30,  # 30% weight: quality
+    0.35   # 35% weight: uniqueness
+])
+# Read-only, since it is the default argument of analyze_all_content: an in-place
+# change by one caller would otherwise change the default for every later call
+DEFAULT_WEIGHTS.setflags(write=False)
+
+# Most distinct post texts each worker remembers scores for
+SCORE_CACHE_SIZE = 4096
+
+# Chunks are sized so that about this many posts are spread over the workers
+# at a time while streaming (bounds chunk size, and so memory, on big files)
+STREAM_BATCH_SIZE = 2048
+
+# Shared read-only default for missing nested fields (no new {} per missing key)
+_EMPTY = {}
+
+@dataclass(slots=True)
+class PostResult:
+    """Combined scores and metadata for one post (fixed slots, no per-row dict)"""
+    # Author info
+    author_name: str
+    username: str
+    post_url: str
+    post_date: str
+    
+    # Text info
+    word_count: int
+    text_preview: str
+    
+    # Engagement metrics
+    likes: int
+    comments: int
+    reposts: int
+    engagement_total: int
+    
+    # Composite score
+    composite_score: float
+    
+    # Algorithm 1: Substance
+    substance_score: float
+    substance_classification: str
+    info_density: float
+    depth: float
+    value_indicators: float
+    
+    # Algorithm 2: Quality
+    quality_score: float
+    quality_classification: str
+    readability: float
+    structure: float
+    professionalism: float
+    readability_grade: str
+    
+    # Algorithm 3: Uniqueness
+    uniqueness_score: float
+    uniqueness_classification: str
+    personal_story: float
+    original_thinking: float
+    specificity: float
+    uniqueness_vs_corpus: float
+
+
+# Per-worker detectors (set up once in each worker process by _init_worker)
+_substance_detector = None
+_quality_assessor = None
+_uniqueness_detector = None
+
+# Per-worker zero scores for posts with no text (image/video-only posts)
+_empty_scores = None
+
+# Per-worker memo of detector results keyed by post text (reposts are common),
+# kept in least-recently-used order and limited to SCORE_CACHE_SIZE texts
+_score_cache = OrderedDict()
+
+# Per-worker handle on the shared TF-IDF block (kept open while the matrix is in use)
+_shared_block = None
+
+
+def _share_matrix(matrix):
+    """
+    Copy a sparse TF-IDF matrix into one shared-memory block
+    
+    Returns the block (owned by the caller, who must close and unlink it) and a
+    small picklable layout that workers use to rebuild the matrix without copying
+    """
+    arrays = (matrix.data, matrix.indices, matrix.indptr)
+    
+    # Lay the three arrays out back to back, each starting on an 8-byte boundary
+    layout, offset = [], 0
+    for array in arrays:
+        layout.append((array.dtype.str, offset, array.size))
+        offset += -(-array.nbytes // 8) * 8
+    
+    block = SharedMemory(create=True, size=max(offset, 1))
+    for array, (dtype, start, size) in zip(arrays, layout):
+        np.ndarray(size, dtype=dtype, buffer=block.buf, offset=start)[:] = array
+    
+    return block, (block.name, matrix.shape, layout)
+
+
+def _attach_matrix(shared_matrix):
+    """Rebuild a CSR matrix whose arrays point straight into the shared block"""
+    global _shared_block
+    
+    name, shape, layout = shared_matrix
+    _shared_block = SharedMemory(name=name)
+    data, indices, indptr = (
+        np.ndarray(size, dtype=dtype, buffer=_shared_block.buf, offset=start)
+        for dtype, start, size in layout
+    )
+    return csr_matrix((data, indices, indptr), shape=shape, copy=False)
+
+
+def _init_worker(shared_matrix):
+    """Build the three detectors once per worker process"""
+    global _substance_detector, _quality_assessor, _uniqueness_detector
+    global _score_cache, _empty_scores
+    
+    # Construct here rather than pickling detectors from the parent, so each
+    # worker compiles its own patterns exactly once (also under `spawn`)
+    _substance_detector = SubstanceDetector()
+    _quality_assessor = QualityAssessor()
+    _uniqueness_detector = UniquenessDetector()
+    
+    # Reuse the corpus prepared in the parent instead of refitting TF-IDF per worker;
+    # the matrix is read from shared memory, not copied into every process
+    if shared_matrix is not None:
+        _uniqueness_detector.tfidf_matrix = _attach_matrix(shared_matrix)
+    
+    _score_cache = OrderedDict()
+    
+    # What each detector returns for an empty post, built once up front
+    _empty_scores = (
+        _substance_detector._create_result(0, "Too short"),
+        _quality_assessor._create_result(0, "Too short"),
+        _uniqueness_detector._create_result(0, "Too short")
+    )
+
+
+def _analyze_one(args):
+    """Run all three algorithms on a single (index, post) pair"""
+    i, post = args
+    
+    # Unpack nested fields once; missing ones fall back to the shared _EMPTY dict
+    text = post.get('text', '')
+    author = post.get('author') or _EMPTY
+    stats = post.get('stats') or _EMPTY
+    posted_at = post.get('posted_at') or _EMPTY
+    
+    likes = stats.get('total_reactions', 0)
+    comments = stats.get('comments', 0)
+    reposts = stats.get('reposts', 0)
+    
+    # Run all three algorithms
+    # (sequentially: their regex/textstat work holds the GIL, so per-post threads
+    # only add overhead; parallelism comes from the worker processes instead)
+    if not text.strip():
+        # No text at all: skip the detectors and use the prebuilt zero scores
+        scores = _empty_scores
+    else:
+        # Exact duplicate texts reuse the first post's scores. The corpus comparison
+        # doesn't depend on post_index for duplicates: identical texts have identical
+        # TF-IDF rows, so each one sees the same set of other posts
+        scores = _score_cache.get(text)
+        if scores is None:
+            scores = _score_cache[text] = (
+                _substance_detector.analyze_post(text),
+                _quality_assessor.analyze_post(text),
+                _uniqueness_detector.analyze_post(text, post_index=i)
+            )
+            if len(_score_cache) > SCORE_CACHE_SIZE:
+                _score_cache.popitem(last=False)  # Forget the least recently used text
+        else:
+            _score_cache.move_to_end(text)  # Now the most recently used
+    substance, quality, uniqueness = scores
+    
+    # Measure the text once and reuse it below
+    text_length = len(text)
+    
+    # Combine all results
+    return PostResult(
+        # Author info
+        author_name=f"{author.get('first_name', '')} {author.get('last_name', '')}".strip(),
+        username=author.get('username', ''),
+        post_url=post.get('url', ''),
+        post_date=posted_at.get('date', ''),
+        
+        # Text info
+        word_count=substance['word_count'],  # Substance detection already split the text into words
+        text_preview=text[:150] + '...' if text_length > 150 else text,
+        
+        # Engagement metrics
+        likes=likes,
+        comments=comments,
+        reposts=reposts,
+        engagement_total=0,  # Summed for all posts at once by analyze_all_content
+        
+        # Composite score (filled in for all posts at once by analyze_all_content)
+        composite_score=0.0,
+        
+        # Algorithm 1: Substance
+        substance_score=substance['total_score'],
+        substance_classification=substance['classification'],
+        info_density=substance['information_density'],
+        depth=substance['depth_score'],
+        value_indicators=substance['value_indicators'],
+        
+        # Algorithm 2: Quality
+        quality_score=quality.total_score,
+        quality_classification=quality.classification,
+        readability=quality.readability,
+        structure=quality.structure,
+        professionalism=quality.professionalism,
+        readability_grade=quality.readability_grade,
+        
+        # Algorithm 3: Uniqueness
+        uniqueness_score=uniqueness['total_score'],
+        uniqueness_classification=uniqueness['classification'],
+        personal_story=uniqueness['personal_story'],
+        original_thinking=uniqueness['original_thinking'],
+        specificity=uniqueness['specificity'],
+        uniqueness_vs_corpus=uniqueness['uniqueness_vs_corpus']
+    )
+
+
+def _analyze_chunk(items):
+    """Run _analyze_one on a chunk of (index, post) pairs inside a worker process"""
+    return [_analyze_one(item) for item in items]
+
+
+def _load_posts(json_file_path):
+    """Load the list of posts, parsing a memory-mapped file with orjson when available"""
+    if orjson is None:
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    with open(json_file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as buffer:
+        return orjson.loads(buffer)
+
+
+def _iter_posts(json_file_path):
+    """Yield posts one at a time from the JSON array without holding them all in memory"""
+    with open(json_file_path, 'rb') as f:
+        # use_float keeps numbers as plain floats instead of Decimal
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+def _iter_chunk_results(executor, function, items, chunk_size, max_pending):
+    """
+    Run `function` on chunks of `items` in the pool, yielding its results in order
+    
+    At most `max_pending` chunks are queued at a time. Each time the oldest
+    chunk's results are handed back, the next chunk is read and submitted, so
+    the workers never wait for a whole batch to finish and the input is only
+    read a little ahead of them (the same queue as quality.iter_analyzed_posts)
+    """
+    iterator = iter(items)
+    pending = deque()  # Futures for the queued chunks, oldest first
+    
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if chunk:
+            pending.append(executor.submit(function, chunk))
+        
+        # Keep the queue full; hand back the oldest chunk once it's done
+        if pending and (not chunk or len(pending) > max_pending):
+            yield from pending.popleft().result()
+        elif not chunk:
+            break
+
+
+def _column(results, key, dtype=np.float64):
+    """Pull one numeric field out of every result as a NumPy array"""
+    return np.fromiter(map(attrgetter(key), results), dtype=dtype, count=len(results))
+
+
+def _write_csv(path, fieldnames, rows):
+    """Write a header plus pre-projected row tuples to a CSV file"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+
+
+def analyze_all_content(json_file_path, weights=DEFAULT_WEIGHTS):
+    """
+    Run all three algorithms and combine results
+    
+    weights: composite weights for (substance, quality, uniqueness)
+    """
     
     print("\n" + "="*80)
     print("🚀 COMPREHENSIVE LINKEDIN CONTENT ANALYSIS SYSTEM")
     print("="*80)
     
     # Load data
+    # With ijson the file is streamed twice - once for the corpus texts, once for
+    # analysis - so the full list of post dicts never sits in memory. Without it,
+    # the file is parsed once and that list is walked twice instead
     print("\n📂 Loading data...")
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        posts = json.load(f)
-    print(f"   ✓ Loaded {len(posts)} posts")
-    
-    # Initialize detectors
-    print("\n🔧 Initializing analysis engines...")
-    substance_detector = SubstanceDetector()
-    quality_assessor = QualityAssessor()
-    uniqueness_detector = UniquenessDetector()
+    posts = None if ijson is not None else _load_posts(json_file_path)
+    
+    def read_posts():
+        return _iter_posts(json_file_path) if posts is None else iter(posts)
     
-    # Prepare uniqueness corpus
-    print("   ✓ Preparing uniqueness corpus...")
-    uniqueness_detector.prepare_corpus(posts)
+    # Prepare uniqueness corpus once in the parent; workers reuse its TF-IDF matrix
+    # (this first pass only keeps each post's text)
+    uniqueness_detector = UniquenessDetector()
+    uniqueness_detector.prepare_corpus(read_posts())
+    post_count = len(uniqueness_detector.all_posts_text)
+    print(f"   ✓ Loaded {post_count} posts")
+    print("   ✓ Prepared uniqueness corpus")
     
-    # Analyze all posts
+    # Analyze all posts across worker processes (each post is independent)
     print("\n🔍 Analyzing posts...")
-    all_results = []
+    all_results = [None] * post_count  # Filled in by position as results arrive
     
-    for i, post in enumerate(posts):
-        if (i + 1) % 500 == 0:
-            print(f"   Progress: {i + 1}/{len(posts)} posts analyzed...")
-        
-        text = post.get('text', '')
-        author = post.get('author', {})
-        stats = post.get('stats', {})
-        
-        # Run all three algorithms
-        substance = substance_detector.analyze_post(text)
-        quality = quality_assessor.analyze_post(text)
-        uniqueness = uniqueness_detector.analyze_post(text, post_index=i)
-        
-        # Calculate composite score (weighted average)
-        composite_score = (
-            substance['total_score'] * 0.35 +  # 35% weight
-            quality['total_score'] * 0.30 +     # 30% weight
-            uniqueness['total_score'] * 0.35    # 35% weight
-        )
-        
-        # Combine all results
-        result = {
-            # Author info
-            'author_name': f"{author.get('first_name', '')} {author.get('last_name', '')}".strip(),
-            'username': author.get('username', ''),
-            'post_url': post.get('url', ''),
-            'post_date': post.get('posted_at', {}).get('date', ''),
-            
-            # Text info
-            'word_count': len(text.split()),
-            'text_preview': text[:150] + '...' if len(text) > 150 else text,
-            
-            # Engagement metrics
-            'likes': stats.get('total_reactions', 0),
-            'comments': stats.get('comments', 0),
-            'reposts': stats.get('reposts', 0),
-            'engagement_total': stats.get('total_reactions', 0) + stats.get('comments', 0) + stats.get('reposts', 0),
-            
-            # Composite score
-            'composite_score': round(composite_score, 2),
-            
-            # Algorithm 1: Substance
-            'substance_score': substance['total_score'],
-            'substance_classification': substance['classification'],
-            'info_density': substance['information_density'],
-            'depth': substance['depth_score'],
-            'value_indicators': substance['value_indicators'],
-            
-            # Algorithm 2: Quality
-            'quality_score': quality['total_score'],
-            'quality_classification': quality['classification'],
-            'readability': quality['readability'],
-            'structure': quality['structure'],
-            'professionalism': quality['professionalism'],
-            'readability_grade': quality['readability_grade'],
+    workers = os.cpu_count() or 1
+    chunksize = max(1, min(post_count, STREAM_BATCH_SIZE) // (4 * workers))
+    
+    # Put the TF-IDF matrix in shared memory once for all workers
+    shared_block = shared_matrix = None
+    if uniqueness_detector.tfidf_matrix is not None:
+        shared_block, shared_matrix = _share_matrix(uniqueness_detector.tfidf_matrix)
+    
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared_matrix,)) as executor:
+            # executor.map would submit (and so parse) every post up front; instead
+            # about 2 chunks per worker are kept queued and topped up as results
+            # come back, so the workers stay busy while memory stays bounded
+            analyzed = _iter_chunk_results(executor, _analyze_chunk, enumerate(read_posts()),
+                                           chunksize, 2 * workers)
             
-            # Algorithm 3: Uniqueness
-            'uniqueness_score': uniqueness['total_score'],
-            'uniqueness_classification': uniqueness['classification'],
-            'personal_story': uniqueness['personal_story'],
-            'original_thinking': uniqueness['original_thinking'],
-            'specificity': uniqueness['specificity'],
-            'uniqueness_vs_corpus': uniqueness['uniqueness_vs_corpus']
-        }
-        
-        all_results.append(result)
+            # Throttled progress bar on stderr; silent when output is redirected
+            for i, result in enumerate(tqdm(analyzed, total=post_count, desc='   Analyzing', unit='post',
+                                            disable=not sys.stderr.isatty())):
+                all_results[i] = result
+    finally:
+        if shared_block is not None:
+            shared_block.close()
+            shared_block.unlink()
+    
+    # Total engagement as one vectorized add over the three counter columns
+    engagement = (_column(all_results, 'likes', np.int64)
+                  + _column(all_results, 'comments', np.int64)
+                  + _column(all_results, 'reposts', np.int64))
+    
+    for result, engagement_total in zip(all_results, engagement.tolist()):
+        result.engagement_total = engagement_total
     
-    print(f"   ✓ Analyzed all {len(posts)} posts!")
+    # Calculate composite scores (weighted average) over an (N posts x 3 scores)
+    # matrix. A row-wise multiply-then-sum adds the terms in the same order as the
+    # scalar formula; a BLAS `@` may fuse/reorder them and flip x.xx5 roundings
+    scores_matrix = np.column_stack([
+        _column(all_results, 'substance_score'),
+        _column(all_results, 'quality_score'),
+        _column(all_results, 'uniqueness_score')
+    ])
+    composite = (scores_matrix * np.asarray(weights, dtype=np.float64)).sum(axis=1)
+    
+    for result, composite_score in zip(all_results, composite.tolist()):
+        result.composite_score = round(composite_score, 2)
+    
+    print(f"   ✓ Analyzed all {post_count} posts!")
     
     return all_results
 
@@ -115,140 +420,137 @@ def generate_reports(results):
     print("\n📊 GENERATING REPORTS...")
     print("-" * 80)
     
-    # Sort by composite score
-    results_sorted = sorted(results, key=lambda x: x['composite_score'], reverse=True)
-    
     # 1. Overall Statistics
     print("\n📈 OVERALL STATISTICS:")
     print(f"   Total Posts Analyzed: {len(results)}")
-    print(f"   Average Composite Score: {sum(r['composite_score'] for r in results) / len(results):.2f}/100")
-    print(f"   Average Substance Score: {sum(r['substance_score'] for r in results) / len(results):.2f}/100")
-    print(f"   Average Quality Score: {sum(r['quality_score'] for r in results) / len(results):.2f}/100")
-    print(f"   Average Uniqueness Score: {sum(r['uniqueness_score'] for r in results) / len(results):.2f}/100")
+    composite_scores = _column(results, 'composite_score')
+    engagement_totals = _column(results, 'engagement_total')
+    print(f"   Average Composite Score: {composite_scores.mean():.2f}/100")
+    print(f"   Average Substance Score: {_column(results, 'substance_score').mean():.2f}/100")
+    print(f"   Average Quality Score: {_column(results, 'quality_score').mean():.2f}/100")
+    print(f"   Average Uniqueness Score: {_column(results, 'uniqueness_score').mean():.2f}/100")
     
     # 2. Top 10 Overall Posts
     print("\n\n🏆 TOP 10 POSTS (COMPOSITE SCORE):")
     print("-" * 80)
-    for i, result in enumerate(results_sorted[:10], 1):
-        print(f"\n{i}. {result['author_name']} (@{result['username']})")
-        print(f"   🎯 Composite: {result['composite_score']}/100")
-        print(f"   📊 Substance: {result['substance_score']}/100 ({result['substance_classification']})")
-        print(f"   ✍️  Quality: {result['quality_score']}/100 ({result['quality_classification']})")
-        print(f"   🦄 Uniqueness: {result['uniqueness_score']}/100 ({result['uniqueness_classification']})")
-        print(f"   💬 Engagement: {result['engagement_total']:,} (👍{result['likes']} 💬{result['comments']} 🔄{result['reposts']})")
-        print(f"   🔗 {result['post_url']}")
+    top_10 = heapq.nlargest(10, results, key=lambda x: x.composite_score)
+    for i, result in enumerate(top_10, 1):
+        print(f"\n{i}. {result.author_name} (@{result.username})")
+        print(f"   🎯 Composite: {result.composite_score}/100")
+        print(f"   📊 Substance: {result.substance_score}/100 ({result.substance_classification})")
+        print(f"   ✍️  Quality: {result.quality_score}/100 ({result.quality_classification})")
+        print(f"   🦄 Uniqueness: {result.uniqueness_score}/100 ({result.uniqueness_classification})")
+        print(f"   💬 Engagement: {result.engagement_total:,} (👍{result.likes} 💬{result.comments} 🔄{result.reposts})")
+        print(f"   🔗 {result.post_url}")
     
     # 3. Best in each category
     print("\n\n🎖️  CATEGORY LEADERS:")
     print("-" * 80)
     
-    best_substance = max(results, key=lambda x: x['substance_score'])
-    print(f"\n🔬 Highest Substance: {best_substance['author_name']}")
-    print(f"   Score: {best_substance['substance_score']}/100")
-    print(f"   {best_substance['post_url']}")
+    best_substance = max(results, key=lambda x: x.substance_score)
+    print(f"\n🔬 Highest Substance: {best_substance.author_name}")
+    print(f"   Score: {best_substance.substance_score}/100")
+    print(f"   {best_substance.post_url}")
     
-    best_quality = max(results, key=lambda x: x['quality_score'])
-    print(f"\n✨ Highest Quality: {best_quality['author_name']}")
-    print(f"   Score: {best_quality['quality_score']}/100")
-    print(f"   {best_quality['post_url']}")
+    best_quality = max(results, key=lambda x: x.quality_score)
+    print(f"\n✨ Highest Quality: {best_quality.author_name}")
+    print(f"   Score: {best_quality.quality_score}/100")
+    print(f"   {best_quality.post_url}")
     
-    best_uniqueness = max(results, key=lambda x: x['uniqueness_score'])
-    print(f"\n💎 Most Unique: {best_uniqueness['author_name']}")
-    print(f"   Score: {best_uniqueness['uniqueness_score']}/100")
-    print(f"   {best_uniqueness['post_url']}")
+    best_uniqueness = max(results, key=lambda x: x.uniqueness_score)
+    print(f"\n💎 Most Unique: {best_uniqueness.author_name}")
+    print(f"   Score: {best_uniqueness.uniqueness_score}/100")
+    print(f"   {best_uniqueness.post_url}")
     
     # 4. Engagement vs. Content Quality Analysis
     print("\n\n📊 ENGAGEMENT VS. CONTENT QUALITY:")
     print("-" * 80)
     
     # Find posts with high scores but low engagement
-    high_quality_low_engagement = [
-        r for r in results 
-        if r['composite_score'] > 70 and r['engagement_total'] < 200
-    ][:5]
+    # (evaluated as one boolean mask over the score arrays)
+    hidden_gems = np.flatnonzero((composite_scores > 70) & (engagement_totals < 200))[:5]
+    high_quality_low_engagement = [results[i] for i in hidden_gems.tolist()]
     
     if high_quality_low_engagement:
         print("\n💎 Hidden Gems (High Quality, Low Engagement):")
         for post in high_quality_low_engagement:
-            print(f"   • {post['author_name']}: {post['composite_score']:.0f} score, {post['engagement_total']} engagement")
+            print(f"   • {post.author_name}: {post.composite_score:.0f} score, {post.engagement_total} engagement")
     
     # Find posts with high engagement
-    high_engagement = sorted(results, key=lambda x: x['engagement_total'], reverse=True)[:5]
+    high_engagement = heapq.nlargest(5, results, key=lambda x: x.engagement_total)
     print("\n🔥 Most Engaged Posts:")
     for post in high_engagement:
-        print(f"   • {post['author_name']}: {post['engagement_total']:,} engagement, {post['composite_score']:.0f} quality score")
+        print(f"   • {post.author_name}: {post.engagement_total:,} engagement, {post.composite_score:.0f} quality score")
     
     # 5. Save comprehensive CSV
     print("\n\n💾 SAVING RESULTS...")
     
-    # Main comprehensive report
+    # Main comprehensive report (the only place that needs the full ordering)
+    results_sorted = sorted(results, key=lambda x: x.composite_score, reverse=True)
+    
     output_file = "/mnt/user-data/outputs/comprehensive_analysis.csv"
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'author_name', 'username', 'post_url', 'post_date', 'word_count',
-            'composite_score', 
-            'substance_score', 'substance_classification',
-            'quality_score', 'quality_classification',
-            'uniqueness_score', 'uniqueness_classification',
-            'likes', 'comments', 'reposts', 'engagement_total',
-            'info_density', 'depth', 'value_indicators',
-            'readability', 'structure', 'professionalism', 'readability_grade',
-            'personal_story', 'original_thinking', 'specificity', 'uniqueness_vs_corpus'
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for result in results_sorted:
-            writer.writerow({k: v for k, v in result.items() if k in fieldnames})
+    fieldnames = [
+        'author_name', 'username', 'post_url', 'post_date', 'word_count',
+        'composite_score', 
+        'substance_score', 'substance_classification',
+        'quality_score', 'quality_classification',
+        'uniqueness_score', 'uniqueness_classification',
+        'likes', 'comments', 'reposts', 'engagement_total',
+        'info_density', 'depth', 'value_indicators',
+        'readability', 'structure', 'professionalism', 'readability_grade',
+        'personal_story', 'original_thinking', 'specificity', 'uniqueness_vs_corpus'
+    ]
     
-    print(f"   ✓ Comprehensive analysis: {output_file}")
+    # Author summary: group posts by author and let NumPy do the per-author sums
+    authors, first_seen, author_index, post_counts = np.unique(
+        [r.author_name for r in results],
+        return_index=True, return_inverse=True, return_counts=True
+    )
+    
+    def author_sums(key):
+        """Sum one score column per author in a single C-level pass"""
+        return np.bincount(author_index, weights=_column(results, key),
+                           minlength=len(authors)).tolist()
+    
+    composite_sums = author_sums('composite_score')
+    substance_sums = author_sums('substance_score')
+    quality_sums = author_sums('quality_score')
+    uniqueness_sums = author_sums('uniqueness_score')
+    engagement_sums = author_sums('engagement_total')
+    
+    # Calculate averages (authors listed in order of first appearance)
+    author_list = []
+    for a in np.argsort(first_seen).tolist():
+        count = int(post_counts[a])
+        author_list.append({
+            'author_name': str(authors[a]),
+            'username': results[first_seen[a]].username,
+            'post_count': count,
+            'avg_composite': round(composite_sums[a] / count, 2),
+            'avg_substance': round(substance_sums[a] / count, 2),
+            'avg_quality': round(quality_sums[a] / count, 2),
+            'avg_uniqueness': round(uniqueness_sums[a] / count, 2),
+            'total_engagement': int(engagement_sums[a])
+        })
+    
+    author_list_sorted = sorted(author_list, key=lambda x: x['avg_composite'], reverse=True)
     
-    # Author summary
-    author_summary = {}
-    for result in results:
-        author = result['author_name']
-        if author not in author_summary:
-            author_summary[author] = {
-                'username': result['username'],
-                'post_count': 0,
-                'avg_composite': 0,
-                'avg_substance': 0,
-                'avg_quality': 0,
-                'avg_uniqueness': 0,
-                'total_engagement': 0
-            }
-        
-        author_summary[author]['post_count'] += 1
-        author_summary[author]['avg_composite'] += result['composite_score']
-        author_summary[author]['avg_substance'] += result['substance_score']
-        author_summary[author]['avg_quality'] += result['quality_score']
-        author_summary[author]['avg_uniqueness'] += result['uniqueness_score']
-        author_summary[author]['total_engagement'] += result['engagement_total']
-    
-    # Calculate averages
-    for author in author_summary:
-        count = author_summary[author]['post_count']
-        author_summary[author]['avg_composite'] = round(author_summary[author]['avg_composite'] / count, 2)
-        author_summary[author]['avg_substance'] = round(author_summary[author]['avg_substance'] / count, 2)
-        author_summary[author]['avg_quality'] = round(author_summary[author]['avg_quality'] / count, 2)
-        author_summary[author]['avg_uniqueness'] = round(author_summary[author]['avg_uniqueness'] / count, 2)
-    
-    # Save author summary
     author_file = "/mnt/user-data/outputs/author_summary.csv"
-    with open(author_file, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['author_name', 'username', 'post_count', 'avg_composite', 
-                     'avg_substance', 'avg_quality', 'avg_uniqueness', 'total_engagement']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        author_list = [
-            {'author_name': name, **data} 
-            for name, data in author_summary.items()
+    author_fieldnames = ['author_name', 'username', 'post_count', 'avg_composite', 
+                         'avg_substance', 'avg_quality', 'avg_uniqueness', 'total_engagement']
+    
+    # Writing CSVs is I/O-bound, so write both files at the same time on threads
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        writes = [
+            executor.submit(_write_csv, output_file, fieldnames,
+                            map(attrgetter(*fieldnames), results_sorted)),
+            executor.submit(_write_csv, author_file, author_fieldnames,
+                            map(itemgetter(*author_fieldnames), author_list_sorted))
         ]
-        author_list_sorted = sorted(author_list, key=lambda x: x['avg_composite'], reverse=True)
-        
-        for author in author_list_sorted:
-            writer.writerow(author)
+        for write in writes:
+            write.result()  # Re-raise any error from the writer thread
     
+    print(f"   ✓ Comprehensive analysis: {output_file}")
     print(f"   ✓ Author summary: {author_file}")
     
     print("\n\n" + "="*80)
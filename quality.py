@@ -12,10 +12,272 @@ This algorithm analyzes LinkedIn posts and gives them a score from 0-100 based o
 Think of it like a writing teacher grading essays, but automated!
 """
 
+import csv   # For writing results to a spreadsheet file
+import heapq  # For picking the top scores without sorting everything
 import json  # For reading JSON files (our LinkedIn data)
+import math  # For rounding readability scores
+import os    # For finding out how many CPU cores we have
 import re    # For pattern matching in text (finding emojis, caps, etc.)
 import textstat  # A library that calculates readability scores
-from collections import Counter  # For counting things efficiently
+from array import array  # Compact lists of plain numbers
+from bisect import bisect_right  # For looking up which band a score falls in
+from collections import Counter, OrderedDict, deque  # Counting / a cache that remembers use order / a simple queue
+from dataclasses import dataclass  # For compact result records
+from functools import lru_cache  # Remembers results for inputs we've already seen
+from itertools import islice  # For taking the next few items from a stream
+from operator import attrgetter, itemgetter, mul  # Field lookups / multiplication as functions
+from concurrent.futures import ProcessPoolExecutor  # Runs work on several CPU cores
+import numpy as np  # For doing the same math on every post at once
+
+try:
+    import ahocorasick  # Optional: finds many keywords in one pass over the text
+except ImportError:
+    ahocorasick = None
+
+try:
+    import ijson  # Optional: reads huge JSON files one post at a time
+except ImportError:
+    ijson = None
+
+
+def _round_half_up(number, digits):
+    """Round the way textstat does (halves away from zero, not to even)"""
+    scale = 10 ** digits
+    return math.floor(number * scale + math.copysign(0.5, number)) / scale
+
+
+def _round_half_up_array(numbers, digits):
+    """_round_half_up for a whole NumPy array at once"""
+    scale = 10 ** digits
+    return np.floor(numbers * scale + np.copysign(0.5, numbers)) / scale
+
+
+@lru_cache(maxsize=16384)
+def _word_syllables(word):
+    """
+    Syllables in a single word.
+    
+    Counting syllables (via a hyphenation dictionary) is the slowest part of
+    readability scoring, but posts reuse the same vocabulary over and over,
+    so each distinct word is only looked up once. The cache holds the 16384
+    most recently used words, enough for a working vocabulary, so it can't
+    keep growing in a long-running worker.
+    """
+    return textstat.syllable_count(word)
+
+
+# Posts with fewer words than this skip the Flesch formulas entirely. They were
+# designed for samples of 100+ words and give meaningless results on a couple of
+# sentences, and syllable counting is the slowest part of scoring a post
+MIN_READABILITY_WORDS = 40
+
+
+# textstat's word and sentence patterns, compiled once here. textstat itself
+# passes them to re as plain strings on every call (and once per sentence when
+# counting sentences), which means a pattern-cache lookup each time
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')        # Punctuation that isn't part of a word
+_SENTENCE_RE = re.compile(r'\b[^.!?]+[.!?]*')   # A sentence and its closing marks
+
+
+def _lexicon_count(text):
+    """Number of words once punctuation is removed (textstat.lexicon_count)"""
+    return len(_PUNCTUATION_RE.sub('', text).split())
+
+
+def _sentence_count(text):
+    """
+    Number of sentences (textstat.sentence_count).
+    
+    Like textstat, fragments of 2 words or fewer don't count as sentences,
+    and every text has at least 1.
+    """
+    sentences = _SENTENCE_RE.findall(text)
+    ignore_count = sum(1 for sentence in sentences if _lexicon_count(sentence) <= 2)
+    return max(1, len(sentences) - ignore_count)
+
+
+def _readability_counts(text):
+    """
+    Words, sentences and syllables in a text - all the Flesch formulas need.
+    
+    Words and syllables both come from the same list of lowercase words with
+    punctuation removed, so that list is built once and used for both counts.
+    (Lowercasing never adds or removes a word, so the word count is the same
+    as textstat.lexicon_count's.)
+    """
+    words = _PUNCTUATION_RE.sub('', text.lower()).split()
+    word_count = len(words)
+    sentence_count = _sentence_count(text)  # Always at least 1
+    syllable_count = sum(map(_word_syllables, words))
+    return word_count, sentence_count, syllable_count
+
+
+def _flesch_formulas(avg_sentence_length, avg_syllables_per_word):
+    """
+    Flesch Reading Ease and Flesch-Kincaid grade (unrounded), with textstat's
+    English constants.
+    
+    This is plain arithmetic, so it works the same on single numbers and on
+    NumPy arrays holding the averages for many posts at once.
+    """
+    flesch = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
+    grade_level = 0.39 * avg_sentence_length + 11.8 * avg_syllables_per_word - 15.59
+    return flesch, grade_level
+
+
+# Readability scores already worked out, by text, least recently used first.
+# Both _readability_scores and the batch path in _analyze_texts fill and check
+# this one cache, so a repost's syllables aren't counted again while it's here
+_readability_cache = OrderedDict()
+READABILITY_CACHE_SIZE = 4096  # Most texts remembered at once
+
+
+def _remember_readability(text, scores):
+    """Cache a text's (flesch, grade_level), forgetting the least recently used past the limit"""
+    _readability_cache[text] = scores
+    if len(_readability_cache) > READABILITY_CACHE_SIZE:
+        _readability_cache.popitem(last=False)
+    return scores
+
+
+def _readability_scores(text):
+    """
+    Flesch Reading Ease and Flesch-Kincaid grade for a text, computed together.
+    
+    Both formulas only need three counts - words, sentences and syllables - so
+    we count them once and apply textstat's English formulas (and rounding)
+    ourselves. Reposts share the same text, so each distinct text is scored once
+    (see _readability_cache).
+    
+    No try/except is needed: the counts can't fail (there is always at least
+    1 sentence), and a text with no words is checked for directly.
+    """
+    scores = _readability_cache.get(text)
+    if scores is not None:
+        _readability_cache.move_to_end(text)  # Now the most recently used
+        return scores
+    
+    word_count, sentence_count, syllable_count = _readability_counts(text)
+    
+    # textstat rounds both averages to 1 decimal before using them
+    avg_sentence_length = _round_half_up(word_count / sentence_count, 1)
+    avg_syllables_per_word = _round_half_up(syllable_count / word_count, 1) if word_count else 0.0
+    
+    flesch, grade_level = _flesch_formulas(avg_sentence_length, avg_syllables_per_word)
+    return _remember_readability(text, (_round_half_up(flesch, 2), _round_half_up(grade_level, 1)))
+
+
+def _readability_scores_batch(texts):
+    """
+    Flesch scores for many texts at once.
+    
+    The counting still happens text by text, but the formulas then run over
+    NumPy arrays holding the counts for every text together (same math and
+    rounding as _readability_scores).
+    
+    Returns a dictionary mapping each text to its (flesch, grade_level) pair.
+    """
+    texts = list(dict.fromkeys(texts))  # Each distinct text once
+    
+    # One row of (words, sentences, syllables) per text. The rows are gathered
+    # in a plain list and turned into an array in one go, rather than writing
+    # each row into the array separately
+    rows = [_readability_counts(text) for text in texts]
+    words, sentences, syllables = np.array(rows, dtype=np.float64).reshape(-1, 3).T
+    
+    # Texts with no words divide by zero here; np.where then swaps in 0.0 for them
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_sentence_length = _round_half_up_array(words / sentences, 1)
+        avg_syllables_per_word = np.where(words > 0, _round_half_up_array(syllables / words, 1), 0.0)
+    
+    # Both formulas for every text in a handful of whole-array operations
+    flesch, grade_level = _flesch_formulas(avg_sentence_length, avg_syllables_per_word)
+    flesch = _round_half_up_array(flesch, 2)
+    grade_level = _round_half_up_array(grade_level, 1)
+    
+    return dict(zip(texts, zip(flesch.tolist(), grade_level.tolist())))
+
+
+@dataclass(slots=True, frozen=True)
+class QualityResult:
+    """
+    The quality scores for one post.
+    
+    A dataclass with slots is a lightweight record: fixed fields, no
+    per-result dictionary, and results read like result.total_score.
+    It is frozen (read-only) because repeated posts share one cached result.
+    """
+    total_score: float        # Main score (rounded to 2 decimals)
+    readability: float        # Breakdown: readability component
+    structure: float          # Breakdown: structure component
+    professionalism: float    # Breakdown: professionalism component
+    grammar_clarity: float    # Breakdown: grammar component
+    penalties: float          # How many points were deducted
+    classification: str       # Label like "High Quality"
+    readability_grade: str    # Reading level (e.g., "Grade 8")
+
+
+# Quality classification bands: a score at or above each threshold moves up one label
+_BAND_THRESHOLDS = [40, 55, 70, 85]
+_BAND_LABELS = ["Low Quality", "Moderate Quality", "Good Quality", "High Quality", "Exceptional Quality"]
+
+# Emoji we count, as (first, last) Unicode code points - written as numbers so
+# the ranges are easy to read and check, instead of as the emoji themselves
+_EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),  # Smileys and people (😀-🙏)
+    (0x1F300, 0x1F5FF),  # Symbols and pictographs (🌀-🗿)
+    (0x1F680, 0x1F6FF),  # Transport and map symbols (🚀-🛿)
+)
+
+# Post details kept alongside each QualityResult, in this order
+POST_INFO_FIELDS = ('author_name', 'username', 'post_url', 'text_preview', 'word_count')
+
+
+def _char_class(ranges):
+    """
+    Regex character class like '[a-z0-9]' for a list of (first, last) code points.
+    
+    Ranges that touch or overlap are joined first (e.g. 🌀-🗿 and 😀-🙏 become
+    one range), so the regex has fewer ranges to compare each character against.
+    """
+    merged = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+    return '[' + ''.join(f'{re.escape(chr(first))}-{re.escape(chr(last))}' for first, last in merged) + ']'
+
+
+def _split_clickbait_patterns(patterns):
+    """
+    Sort clickbait patterns into plain phrases and real regexes.
+    
+    Plain phrases can go into the one-pass keyword scan; only patterns that
+    use regex features (like an optional space or dash) have to stay as regexes.
+    """
+    phrases = []
+    regexes = []
+    for pattern in patterns:
+        phrase = pattern.replace("\\'", "'")
+        if any(char in phrase for char in '\\[](){}?*+|.^$'):
+            regexes.append(pattern)
+        else:
+            phrases.append(phrase)
+    return phrases, regexes
+
+
+def _build_automaton(keywords):
+    """Build an Aho-Corasick automaton over (phrase, category) pairs, if pyahocorasick is installed"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for phrase, category in keywords:
+        automaton.add_word(phrase, (phrase, category))
+    automaton.make_automaton()
+    return automaton
+
 
 class QualityAssessor:
     """
@@ -24,55 +286,115 @@ class QualityAssessor:
     A "class" is like a blueprint for creating an object that has both:
     - Data (the patterns and words we look for)
     - Functions (the methods that analyze posts)
+    
+    The patterns and keywords below belong to the class itself, so they are
+    set up once when this file is loaded and shared by every QualityAssessor
+    (and by worker processes forked from this one) instead of being rebuilt
+    each time an assessor is created.
     """
     
+    # CLICKBAIT PATTERNS
+    # These are phrases that make content feel spammy or sensationalist
+    # We'll penalize posts that use these
+    clickbait_patterns = (
+        r'you won\'t believe',      # "You won't believe what happened!"
+        r'shocking',                # "Shocking news!"
+        r'this one trick',          # "This one trick will change everything"
+        r'what happened next',      # Classic clickbait phrase
+        r'blown away',              # "I was blown away by..."
+        r'mind[\s-]?blown',        # "Mind-blown" or "mind blown"
+        r'game[\s-]?changer',      # Overused buzzword
+        r'the secret to',           # "The secret to success is..."
+        r'everyone is talking about'# Bandwagon appeal
+    )
+    
+    # PROFESSIONAL VOCABULARY
+    # These words indicate sophisticated business writing
+    # Using these appropriately = higher score
+    professional_words = (
+        'strategy', 'implement', 'framework', 'optimize', 'leverage',
+        'scalable', 'metrics', 'efficiency', 'revenue', 'growth',
+        'innovation', 'transformation', 'execution', 'alignment'
+    )
+    
+    # SPAM/LOW-QUALITY INDICATORS
+    # These phrases scream "sales pitch" or "spam"
+    # We heavily penalize these
+    spam_indicators = (
+        'dm me',           # "DM me for more info"
+        'link in bio',     # Instagram-style call to action
+        'click here',      # Generic spam phrase
+        'limited time',    # Artificial urgency
+        'act now',         # Pressure tactic
+        'buy now',         # Direct sales pitch
+        'cheap',           # Low-quality indicator
+        'make money fast'  # Classic spam phrase
+    )
+    
+    # PROFESSIONAL SIGN-OFFS
+    # Closings that show polish
+    signoff_phrases = ('p.s.', 'best regards', 'cheers')
+    
+    # LOGICAL FLOW MARKERS
+    # Transition words show logical progression of ideas
+    # Examples: "however" (contrast), "therefore" (conclusion), "first" (sequence)
+    transition_words = (
+        'however', 'therefore', 'additionally', 'furthermore', 
+        'first', 'second', 'finally', 'in conclusion'
+    )
+    
+    # TENSE MARKERS
+    # Common verbs that show whether a sentence is in the past or present tense
+    past_tense_markers = ('was', 'were', 'had', 'did', 'went', 'got')
+    present_tense_markers = ('is', 'are', 'have', 'do', 'goes', 'get')
+    _past_tense_set = frozenset(past_tense_markers)
+    
+    # ONE-PASS KEYWORD MATCHING
+    # Professional words, spam phrases, sign-offs, transition words and the plain-text
+    # clickbait phrases are all looked up together, so the text is scanned once instead of once per list.
+    # Only clickbait patterns that really need regex features stay as regexes
+    _clickbait_phrases, _clickbait_regexes = _split_clickbait_patterns(clickbait_patterns)
+    
+    _keywords = (
+        [(word, 'professional') for word in professional_words] +
+        [(phrase, 'spam') for phrase in spam_indicators] +
+        [(phrase, 'signoff') for phrase in signoff_phrases] +
+        [(word, 'transition') for word in transition_words] +
+        [(phrase, 'clickbait') for phrase in _clickbait_phrases]
+    )
+    
+    # Building it takes a few microseconds, once per process when this file is
+    # loaded, so it isn't worth saving to disk between runs
+    _automaton = _build_automaton(_keywords)
+    
+    # SENTENCE SPLITTING TABLE
+    # Turns every ! and ? into a . so sentences can be split with plain str.split
+    # (a fast built-in) instead of running a regex over the text
+    _sentence_end_table = str.maketrans('!?', '..')
+    
+    # PRECOMPILED PATTERNS
+    # Compiling a regex turns the pattern text into a matching machine.
+    # Doing it once here (instead of on every post) saves that work each time
+    _clickbait_res = [re.compile(p) for p in _clickbait_regexes]
+    # All regex-only clickbait patterns joined into one, to rule them all out in one scan
+    _clickbait_union = re.compile('|'.join(f'(?:{p})' for p in _clickbait_regexes)) if _clickbait_regexes else None
+    _num_list_re = re.compile(r'\n\d+[\.\)]\s')                      # Numbered list items
+    _emoji_re = re.compile(_char_class(_EMOJI_RANGES))               # Common emoji ranges
+    _caps3_re = re.compile(r'\b[A-Z]{3,}\b')                         # ALL CAPS words (3+ letters)
+    _tense_re = re.compile(                                          # Past or present tense markers
+        r'\b(' + '|'.join(past_tense_markers + present_tense_markers) + r')\b')
+    # Letters repeated 4+ times. Spelled out as \1\1\1+ rather than \1{3,}: it
+    # matches exactly the same runs, but re checks it noticeably faster
+    _repeat_re = re.compile(r'(\w)\1\1\1+')
+    
+    # Most distinct texts one assessor remembers results for
+    result_cache_size = 16384
+    
     def __init__(self):
-        """
-        This function runs when we create a new QualityAssessor.
-        It sets up all the patterns and keywords we'll use to evaluate posts.
-        
-        Think of this as preparing your toolkit before starting work.
-        """
-        
-        # CLICKBAIT PATTERNS
-        # These are phrases that make content feel spammy or sensationalist
-        # We'll penalize posts that use these
-        self.clickbait_patterns = [
-            r'you won\'t believe',      # "You won't believe what happened!"
-            r'shocking',                # "Shocking news!"
-            r'this one trick',          # "This one trick will change everything"
-            r'what happened next',      # Classic clickbait phrase
-            r'blown away',              # "I was blown away by..."
-            r'mind[\s-]?blown',        # "Mind-blown" or "mind blown"
-            r'game[\s-]?changer',      # Overused buzzword
-            r'the secret to',           # "The secret to success is..."
-            r'everyone is talking about'# Bandwagon appeal
-        ]
-        
-        # PROFESSIONAL VOCABULARY
-        # These words indicate sophisticated business writing
-        # Using these appropriately = higher score
-        self.professional_words = [
-            'strategy', 'implement', 'framework', 'optimize', 'leverage',
-            'scalable', 'metrics', 'efficiency', 'revenue', 'growth',
-            'innovation', 'transformation', 'execution', 'alignment'
-        ]
-        
-        # SPAM/LOW-QUALITY INDICATORS
-        # These phrases scream "sales pitch" or "spam"
-        # We heavily penalize these
-        self.spam_indicators = [
-            'dm me',           # "DM me for more info"
-            'link in bio',     # Instagram-style call to action
-            'click here',      # Generic spam phrase
-            'limited time',    # Artificial urgency
-            'act now',         # Pressure tactic
-            'buy now',         # Direct sales pitch
-            'cheap',           # Low-quality indicator
-            'make money fast'  # Classic spam phrase
-        ]
-    
-    def analyze_post(self, text):
+        """Set up this assessor's own cache of results, by text (see analyze_post)"""
+        self._results = OrderedDict()  # Least recently used first
+    
+    def analyze_post(self, text, readability_scores=None):
         """
         This is the MAIN function that analyzes a single post.
         
@@ -86,38 +408,85 @@ class QualityAssessor:
         3. Apply penalties for bad practices (clickbait, spam, etc.)
         4. Add everything up to get a final score out of 100
         
+        Results are cached per assessor, by text (up to result_cache_size texts):
+        reposts and duplicate texts are only analyzed once.
+        
         Parameters:
             text (string): The content of the LinkedIn post
+            readability_scores (tuple, optional): Precomputed (flesch, grade_level)
+                for this text, e.g. from _readability_scores_batch
             
         Returns:
-            A dictionary with the score and breakdown
+            A QualityResult with the score and breakdown
         """
         
+        # Reposts and duplicates: hand back the result we already have
+        result = self._results.get(text)
+        if result is not None:
+            self._results.move_to_end(text)  # Now the most recently used
+            return result
+        
+        result = self._results[text] = self._analyze_post(text, readability_scores)
+        if len(self._results) > self.result_cache_size:
+            self._results.popitem(last=False)  # Forget the least recently used text
+        return result
+    
+    def _analyze_post(self, text, readability_scores):
+        """The analysis behind analyze_post, without the cache"""
+        
         # STEP 1: Check if post is too short to analyze
         if not text or len(text.strip()) < 30:
             return self._create_result(0, "Too short")
         
         # Convert text to lowercase for easier matching
         # (We do this because "HELLO" and "hello" should be treated the same)
+        # Done once here and passed to every check that needs it
         text_lower = text.lower()
         
+        # Split text into sentences (splitting on . ! or ?) and count the words in
+        # each one, once for every check below. Pieces with no words (like the gap
+        # inside "?!") are dropped. The counts are kept in a compact array of
+        # plain integers rather than a list of Python int objects
+        pieces = text.translate(self._sentence_end_table).split('.')
+        sentence_lengths = array('i', [count for count in map(len, map(str.split, pieces)) if count])
+        
         # STEP 2: Calculate the 4 component scores
         # Each function returns a score from 0-25 points
         
-        readability = self._score_readability(text)
+        # Word count, used by the readability shortcut and the comma check
+        word_count = len(text.split())
+        
+        # Both Flesch scores are computed once here (unless passed in) and shared
+        # by the readability score and the grade label. Posts under
+        # MIN_READABILITY_WORDS words are too short for the formulas, so they
+        # skip textstat and get None; the readability parts then fall back to
+        # defaults. That length check replaces catching errors from textstat
+        if word_count < MIN_READABILITY_WORDS:
+            readability_scores = None
+        elif readability_scores is None:
+            readability_scores = _readability_scores(text)
+        flesch, grade_level = readability_scores or (None, None)
+        
+        readability = self._score_readability(sentence_lengths, flesch, grade_level)
         # ^ How easy is this to read? Grade level appropriate?
         
-        structure = self._score_structure(text)
+        keyword_counts = self._count_keywords(text_lower)
+        # ^ How many professional, spam, sign-off, transition and clickbait phrases appear (one scan)
+        
+        structure = self._score_structure(text, keyword_counts)
         # ^ Is it formatted well? Has paragraphs, lists, etc.?
         
-        professionalism = self._score_professionalism(text, text_lower)
+        caps_words = self._caps3_re.findall(text)
+        # ^ ALL CAPS words (3+ letters); the 4+ letter ones are a subset of these
+        
+        professionalism = self._score_professionalism(text, text_lower, keyword_counts, caps_words)
         # ^ Does it sound professional? Right vocabulary? Not too many emojis?
         
-        grammar = self._score_grammar_clarity(text)
+        grammar = self._score_grammar_clarity(text, text_lower, sentence_lengths, word_count)
         # ^ Are sentences complete? Good use of commas? Consistent tense?
         
         # STEP 3: Calculate penalties for bad practices
-        penalties = self._calculate_penalties(text, text_lower)
+        penalties = self._calculate_penalties(text, text_lower, keyword_counts, caps_words)
         # ^ Deduct points for clickbait, spam, excessive caps, etc.
         
         # STEP 4: Calculate total score
@@ -128,19 +497,44 @@ class QualityAssessor:
         # Make sure score doesn't exceed 100
         normalized_score = min(100, total_score)
         
-        # STEP 5: Return all the results in a dictionary
-        return {
-            'total_score': round(normalized_score, 2),  # Main score (rounded to 2 decimals)
-            'readability': round(readability, 2),        # Breakdown: readability component
-            'structure': round(structure, 2),            # Breakdown: structure component
-            'professionalism': round(professionalism, 2),# Breakdown: professionalism component
-            'grammar_clarity': round(grammar, 2),        # Breakdown: grammar component
-            'penalties': round(penalties, 2),            # How many points were deducted
-            'classification': self._classify_quality(normalized_score),  # Label like "High Quality"
-            'readability_grade': self._get_readability_grade(text)       # Reading level (e.g., "Grade 8")
-        }
-    
-    def _score_readability(self, text):
+        # STEP 5: Return all the results as a QualityResult
+        return QualityResult(
+            total_score=round(normalized_score, 2),
+            readability=round(readability, 2),
+            structure=round(structure, 2),
+            professionalism=round(professionalism, 2),
+            grammar_clarity=round(grammar, 2),
+            penalties=round(penalties, 2),
+            classification=self._classify_quality(normalized_score),
+            readability_grade=self._get_readability_grade(grade_level)
+        )
+    
+    def _count_keywords(self, text_lower):
+        """
+        Count how many different keywords from each category appear in the text.
+        
+        Each keyword counts once no matter how often it is repeated, e.g.
+        {'professional': 3, 'spam': 1}
+        """
+        second = itemgetter(1)  # Picks the second item out of a pair, in C
+        
+        if self._automaton is not None:
+            # Aho-Corasick reports every keyword hit in a single pass over the text,
+            # as (end position, (phrase, category)) pairs; the set keeps each
+            # (phrase, category) once however often it was repeated
+            found = set(map(second, self._automaton.iter(text_lower)))
+        else:
+            # Without pyahocorasick, one fast 'in' search per keyword beats a
+            # single regex of all the keywords: re would have to try every
+            # keyword at every position to find overlapping matches
+            found = {(phrase, category) for phrase, category in self._keywords
+                     if phrase in text_lower}
+        
+        # Keywords are matched anywhere in the text (like 'in'), not only as whole
+        # words, so e.g. "optimize" also counts inside "optimized"
+        return Counter(map(second, found))
+    
+    def _score_readability(self, sentence_lengths, flesch, grade_level):
         """
         READABILITY SCORING (0-25 points possible)
         
@@ -151,71 +545,71 @@ class QualityAssessor:
         - Flesch-Kincaid Grade Level: What grade level is needed to understand this?
         
         We also check for sentence length variety (good writers mix short and long sentences)
+        
+        sentence_lengths holds the word count of each sentence; flesch and
+        grade_level are the two Flesch scores (None if the post is too short
+        for them)
         """
         score = 0  # Start at 0 and add points
         
-        try:
-            # FLESCH READING EASE SCORE
-            # This gives a score from 0-100, where:
-            # - 90-100 = Very easy (5th grade level)
-            # - 60-70 = Easy (8th-9th grade)
-            # - 30-50 = Difficult (college level)
-            # - 0-30 = Very difficult (graduate level)
-            flesch = textstat.flesch_reading_ease(text)
-            
-            # For LinkedIn business content, we want 50-70 (fairly easy)
-            # This is readable but still sophisticated
-            if 50 <= flesch <= 70:
-                score += 10  # Perfect range - full points
-            elif 40 <= flesch < 50 or 70 < flesch <= 80:
-                score += 7   # Close to ideal - most points
-            elif flesch > 30:
-                score += 4   # Readable enough - some points
-            # If flesch is below 30, we give 0 points (too difficult)
+        if flesch is None:
+            # Short posts get an average score instead
+            return 12
+        
+        # FLESCH READING EASE SCORE
+        # This gives a score from 0-100, where:
+        # - 90-100 = Very easy (5th grade level)
+        # - 60-70 = Easy (8th-9th grade)
+        # - 30-50 = Difficult (college level)
+        # - 0-30 = Very difficult (graduate level)
+        
+        # For LinkedIn business content, we want 50-70 (fairly easy)
+        # This is readable but still sophisticated
+        if 50 <= flesch <= 70:
+            score += 10  # Perfect range - full points
+        elif 40 <= flesch < 50 or 70 < flesch <= 80:
+            score += 7   # Close to ideal - most points
+        elif flesch > 30:
+            score += 4   # Readable enough - some points
+        # If flesch is below 30, we give 0 points (too difficult)
+        
+        # FLESCH-KINCAID GRADE LEVEL
+        # This tells us what US grade level is needed to understand the text
+        # Examples: 8.0 = 8th grade, 12.0 = high school senior
+        
+        # We want grade 8-12 (accessible but sophisticated)
+        if 8 <= grade_level <= 12:
+            score += 10  # Ideal range
+        elif 6 <= grade_level < 8 or 12 < grade_level <= 14:
+            score += 7   # Close to ideal
+        elif grade_level < 16:
+            score += 4   # Not terrible
+        # Above grade 16 gets 0 points (too academic for LinkedIn)
+        
+        # SENTENCE LENGTH VARIATION
+        # Good writers vary their sentence length (mix of short and long)
+        # Bad writers use only short sentences or only long ones
+        
+        n = len(sentence_lengths)
+        if n > 1:  # Need at least 2 sentences to compare
+            # Check the standard deviation (how much the lengths vary)
+            # Higher std_dev = more variety = better
+            # std_dev > 5 is the same as variance > 25, and
+            #   variance = (n * sum of squares - total^2) / n^2
+            # so we can compare whole numbers: exact, no square root, and the
+            # sums run in fast built-ins instead of a Python loop
+            # (np.std would be slower here: a post has only a handful of
+            # sentences, so converting them to an array costs more than it saves)
+            total = sum(sentence_lengths)
+            sum_of_squares = sum(map(mul, sentence_lengths, sentence_lengths))
             
-            # FLESCH-KINCAID GRADE LEVEL
-            # This tells us what US grade level is needed to understand the text
-            # Examples: 8.0 = 8th grade, 12.0 = high school senior
-            grade_level = textstat.flesch_kincaid_grade(text)
-            
-            # We want grade 8-12 (accessible but sophisticated)
-            if 8 <= grade_level <= 12:
-                score += 10  # Ideal range
-            elif 6 <= grade_level < 8 or 12 < grade_level <= 14:
-                score += 7   # Close to ideal
-            elif grade_level < 16:
-                score += 4   # Not terrible
-            # Above grade 16 gets 0 points (too academic for LinkedIn)
-            
-            # SENTENCE LENGTH VARIATION
-            # Good writers vary their sentence length (mix of short and long)
-            # Bad writers use only short sentences or only long ones
-            
-            # Split text into sentences (splitting on . ! or ?)
-            sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-            
-            if len(sentences) > 1:  # Need at least 2 sentences to compare
-                # Count words in each sentence
-                sentence_lengths = [len(s.split()) for s in sentences]
-                
-                # Calculate standard deviation (how much the lengths vary)
-                # Higher std_dev = more variety = better
-                avg_length = sum(sentence_lengths) / len(sentence_lengths)
-                variance = sum((x - avg_length)**2 for x in sentence_lengths) / len(sentence_lengths)
-                std_dev = variance**0.5
-                
-                if std_dev > 5:  # Good variety in sentence length
-                    score += 5
-        
-        except:
-            # If textstat fails for any reason, give an average score
-            # This happens rarely but we want the code to keep running
-            score = 12
+            if n * sum_of_squares - total * total > 25 * n * n:  # Good variety in sentence length
+                score += 5
         
         # Make sure we don't exceed 25 points for this section
         return min(25, score)
     
-    def _score_structure(self, text):
+    def _score_structure(self, text, keyword_counts):
         """
         STRUCTURE SCORING (0-25 points possible)
         
@@ -232,15 +626,17 @@ class QualityAssessor:
         # PARAGRAPH BREAKS
         # Posts split into paragraphs are easier to read than walls of text
         # We look for double line breaks (\n\n) which indicate new paragraphs
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        # (only the number of non-blank paragraphs matters, so they are counted
+        # without building a list of stripped copies)
+        paragraph_count = sum(1 for p in text.split('\n\n') if p and not p.isspace())
         
         # Also count total line breaks (single \n)
         line_breaks = text.count('\n')
         
         # Award points based on number of paragraphs
-        if len(paragraphs) >= 3:
+        if paragraph_count >= 3:
             score += 6  # Multiple paragraphs = well organized
-        elif len(paragraphs) >= 2:
+        elif paragraph_count >= 2:
             score += 4  # At least split into sections
         
         # Award points for having line breaks
@@ -251,34 +647,37 @@ class QualityAssessor:
         # The first line should be short and punchy to grab attention
         # Too short (<5 words) = incomplete thought
         # Too long (>20 words) = loses impact
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
-        if lines:
-            first_line = lines[0]
-            word_count_first = len(first_line.split())
+        # The first non-blank line starts at the first non-space character,
+        # so there's no need to split the whole post into lines to find it
+        first_line = text.lstrip().partition('\n')[0]
+        if first_line:
+            # We only need to know whether it has 5-20 words, so split at most
+            # 20 times: anything longer comes back as 21 pieces (still "> 20")
+            word_count_first = len(first_line.split(maxsplit=20))
             
             if 5 <= word_count_first <= 20:
                 score += 5  # Sweet spot for opening line
         
         # CLEAR SECTIONS OR LISTS
+        # Both kinds of list need line breaks, which were counted above: a dashed
+        # list needs 2 of them and a numbered list at least 1. Posts without
+        # enough line breaks skip those scans, and once a bullet list is found
+        # there's no need to look for a numbered one
+        
         # Look for bullet points (•) or dashed lists (-)
-        has_bullets = '•' in text or text.count('\n-') >= 2
+        has_bullets = '•' in text or (line_breaks >= 2 and text.count('\n-') >= 2)
         
         # Look for numbered lists (1. 2. or 1) 2))
-        has_numbers = bool(re.search(r'\n\d+[\.\)]\s', text))
+        has_numbers = not has_bullets and line_breaks >= 1 and bool(self._num_list_re.search(text))
         
         if has_bullets or has_numbers:
             score += 5  # Lists make content scannable
         
         # LOGICAL FLOW MARKERS
         # Transition words show logical progression of ideas
-        # Examples: "however" (contrast), "therefore" (conclusion), "first" (sequence)
-        transition_words = [
-            'however', 'therefore', 'additionally', 'furthermore', 
-            'first', 'second', 'finally', 'in conclusion'
-        ]
-        
-        # Count how many transition words appear
-        transitions_found = sum(1 for word in transition_words if word in text.lower())
+        # Count how many of the transition words (listed at the top of the class) appear
+        # (already found by the one-pass keyword scan)
+        transitions_found = keyword_counts['transition']
         
         # Award up to 5 points (1.5 points per transition word found)
         score += min(5, transitions_found * 1.5)
@@ -286,7 +685,7 @@ class QualityAssessor:
         # Cap at 25 points
         return min(25, score)
     
-    def _score_professionalism(self, text, text_lower):
+    def _score_professionalism(self, text, text_lower, keyword_counts, caps_words):
         """
         PROFESSIONALISM SCORING (0-25 points possible)
         
@@ -303,7 +702,7 @@ class QualityAssessor:
         # PROFESSIONAL VOCABULARY USAGE
         # Count how many professional business words appear
         # Words like "strategy", "implement", "framework" signal expertise
-        prof_word_count = sum(1 for word in self.professional_words if word in text_lower)
+        prof_word_count = keyword_counts['professional']
         
         # Award up to 5 points (0.8 points per professional word)
         score += min(5, prof_word_count * 0.8)
@@ -311,7 +710,8 @@ class QualityAssessor:
         # EMOJI USAGE
         # Emojis can add personality, but too many look unprofessional
         # We use Unicode ranges to detect common emojis
-        emoji_count = len(re.findall(r'[😀-🙏🌀-🗿🚀-🛿]', text))
+        # (plain-ASCII posts can't contain any, and isascii() answers that instantly)
+        emoji_count = 0 if text.isascii() else len(self._emoji_re.findall(text))
         
         if emoji_count == 0:
             score += 3  # Clean and professional
@@ -323,21 +723,20 @@ class QualityAssessor:
         
         # CAPITALIZATION ISSUES
         # ALL CAPS WORDS look like SHOUTING
-        # Find words that are 3+ characters and all capitals
-        caps_words = re.findall(r'\b[A-Z]{3,}\b', text)
-        
+        # caps_words holds the words that are 3+ characters and all capitals
         if len(caps_words) > 5:
             score -= 3  # Too much shouting - penalize
         
         # PROFESSIONAL SIGN-OFF
         # Posts that end with "P.S.", "Best regards", or "Cheers" show polish
-        if 'p.s.' in text_lower or 'best regards' in text_lower or 'cheers' in text_lower:
+        # (already found by the one-pass keyword scan, so no extra searches here)
+        if keyword_counts['signoff']:
             score += 2  # Bonus for professional closing
         
         # Keep score in valid range (0-25)
         return min(25, max(0, score))
     
-    def _score_grammar_clarity(self, text):
+    def _score_grammar_clarity(self, text, text_lower, sentence_lengths, word_count):
         """
         GRAMMAR & CLARITY SCORING (0-25 points possible)
         
@@ -355,23 +754,25 @@ class QualityAssessor:
         # Each line should end with proper punctuation (. ! or ?)
         # This indicates complete thoughts, not fragments
         
-        lines = [l.strip() for l in text.split('\n') if l.strip() and len(l.strip()) > 10]
-        # ^ Get all lines that aren't empty and have at least 10 characters
+        lines = [l for l in map(str.strip, text.split('\n')) if len(l) > 10]
+        # ^ Get all lines that have more than 10 characters once stripped
+        #   (each line is stripped once, and a line that long can't be empty)
         
         # Count how many lines end with punctuation
         complete_sentences = sum(1 for line in lines if line[-1] in '.!?')
         
         # If >70% of lines are complete sentences, that's good
-        if complete_sentences / max(len(lines), 1) > 0.7:
+        # (written as 10 * complete > 7 * lines so it stays whole-number math)
+        if 10 * complete_sentences > 7 * len(lines):
             score += 5
         
         # AVOID RUN-ON SENTENCES
         # Sentences over 40 words are usually run-ons (too long without breaks)
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-        long_sentences = sum(1 for s in sentences if len(s.split()) > 40)
+        long_sentences = sum(1 for length in sentence_lengths if length > 40)
         
         # If <20% of sentences are too long, that's good
-        if long_sentences / max(len(sentences), 1) < 0.2:
+        # (5 * long < total is the same test; with no sentences at all, 0 < 1 passes)
+        if 5 * long_sentences < max(len(sentence_lengths), 1):
             score += 3
         
         # PROPER COMMA USAGE
@@ -379,9 +780,8 @@ class QualityAssessor:
         # Too few commas = confusing writing
         # Sweet spot: 1-4 commas per 100 words
         
-        words = len(text.split())
         commas = text.count(',')
-        comma_ratio = commas / max(words, 1) * 100  # Commas per 100 words
+        comma_ratio = commas / max(word_count, 1) * 100  # Commas per 100 words
         
         if 1 <= comma_ratio <= 4:  # Healthy range
             score += 3
@@ -390,23 +790,26 @@ class QualityAssessor:
         # Good writing maintains consistent verb tense (past vs. present)
         # We count common past and present tense verb markers
         
-        past_markers = len(re.findall(r'\b(was|were|had|did|went|got)\b', text.lower()))
-        present_markers = len(re.findall(r'\b(is|are|have|do|goes|get)\b', text.lower()))
+        # Both kinds are found in one scan; then the past ones are counted
+        # (everything else found is a present tense marker)
+        markers = self._tense_re.findall(text_lower)
+        past_markers = sum(map(self._past_tense_set.__contains__, markers))
+        present_markers = len(markers) - past_markers
         
         # Calculate consistency
         # If you use mostly past OR mostly present (>70%), that's consistent
+        # (dominant / total > 0.7, compared as 10 * dominant > 7 * total)
         if past_markers + present_markers > 0:
             dominant = max(past_markers, present_markers)
             total = past_markers + present_markers
-            consistency = dominant / total
             
-            if consistency > 0.7:  # Consistent tense usage
+            if 10 * dominant > 7 * total:  # Consistent tense usage
                 score += 4
         
         # Cap at 25 points
         return min(25, score)
     
-    def _calculate_penalties(self, text, text_lower):
+    def _calculate_penalties(self, text, text_lower, keyword_counts, caps_words):
         """
         PENALTIES (0-20 points deducted)
         
@@ -423,16 +826,21 @@ class QualityAssessor:
         
         # CLICKBAIT DETECTION
         # Count how many clickbait patterns appear in the text
-        clickbait_count = sum(1 for pattern in self.clickbait_patterns 
-                             if re.search(pattern, text_lower))
+        # (plain phrases were already counted; only the regex ones are searched here)
+        clickbait_count = keyword_counts['clickbait']
+        
+        # Most posts match none of the regex patterns, which one combined search
+        # settles. Only if something matched do we check the patterns one by one,
+        # so each pattern still counts once
+        if self._clickbait_union is not None and self._clickbait_union.search(text_lower):
+            clickbait_count += sum(1 for pattern in self._clickbait_res if pattern.search(text_lower))
         
         # Deduct 4 points per clickbait phrase
         penalty += clickbait_count * 4
         
         # SPAM INDICATORS
         # Count how many spam phrases appear
-        spam_count = sum(1 for indicator in self.spam_indicators 
-                        if indicator in text_lower)
+        spam_count = keyword_counts['spam']
         
         # Deduct 5 points per spam indicator (heavy penalty)
         penalty += spam_count * 5
@@ -440,20 +848,21 @@ class QualityAssessor:
         # EXCESSIVE PUNCTUATION
         # Multiple exclamation or question marks look unprofessional
         # "This is amazing!!!" or "Really???"
-        if text.count('!!!') > 0 or text.count('???') > 0:
+        if '!!!' in text or '???' in text:
             penalty += 3
         
         # ALL CAPS WORDS (SCREAMING)
-        # Find words that are 4+ characters and all capitals
-        all_caps_words = re.findall(r'\b[A-Z]{4,}\b', text)
+        # Count words that are 4+ characters and all capitals
+        # (picked out of the 3+ letter caps words instead of scanning the text again)
+        all_caps_count = sum(1 for word in caps_words if len(word) >= 4)
         
-        if len(all_caps_words) > 3:
+        if all_caps_count > 3:
             penalty += 4  # Too much shouting
         
         # TYPOS/SPELLING ERRORS
         # Simple check: look for repeated letters (4+ times)
         # Examples: "sooooo", "nooooo", "yessss"
-        typo_patterns = re.findall(r'(\w)\1{3,}', text_lower)
+        typo_patterns = self._repeat_re.findall(text_lower)
         
         # Deduct 2 points per typo-like pattern
         penalty += len(typo_patterns) * 2
@@ -472,100 +881,167 @@ class QualityAssessor:
         - 40-54: Moderate Quality (okay but needs work)
         - <40: Low Quality (poor)
         """
-        if score >= 85:
-            return "Exceptional Quality"
-        elif score >= 70:
-            return "High Quality"
-        elif score >= 55:
-            return "Good Quality"
-        elif score >= 40:
-            return "Moderate Quality"
-        else:
-            return "Low Quality"
+        # bisect_right counts how many thresholds the score has reached,
+        # which is exactly the position of its label in _BAND_LABELS
+        return _BAND_LABELS[bisect_right(_BAND_THRESHOLDS, score)]
     
-    def _get_readability_grade(self, text):
+    def _get_readability_grade(self, grade_level):
         """
-        Get the reading grade level as a formatted string.
+        Format the Flesch-Kincaid grade level as a string.
         
         Example: "Grade 8.5" means you need 8th grade reading skills.
         """
-        try:
-            grade = textstat.flesch_kincaid_grade(text)
-            return f"Grade {round(grade, 1)}"
-        except:
-            return "N/A"  # If calculation fails, return "Not Available"
+        if grade_level is None:
+            return "N/A"  # Too short to grade: "Not Available"
+        return f"Grade {round(grade_level, 1)}"
     
     def _create_result(self, score, reason):
         """
-        Helper function to create a result dictionary with default values.
+        Helper function to create a QualityResult with default values.
         Used when a post is too short to analyze.
         """
-        return {
-            'total_score': score,
-            'readability': 0,
-            'structure': 0,
-            'professionalism': 0,
-            'grammar_clarity': 0,
-            'penalties': 0,
-            'classification': reason,
-            'readability_grade': 'N/A'
-        }
+        return QualityResult(
+            total_score=score,
+            readability=0,
+            structure=0,
+            professionalism=0,
+            grammar_clarity=0,
+            penalties=0,
+            classification=reason,
+            readability_grade='N/A'
+        )
 
 
-def analyze_all_posts(json_file_path):
+# Each worker process builds its own QualityAssessor once (see _init_worker)
+_assessor = None
+
+
+def _init_worker():
+    """Create the assessor once per worker process instead of pickling it per task"""
+    global _assessor
+    _assessor = QualityAssessor()
+
+
+def _analyze_texts(texts):
+    """Analyze one chunk of post texts inside a worker process"""
+    # Readability formulas for every new text in the chunk long enough to need
+    # them, in one vectorized batch. They go into the shared readability cache,
+    # where analyze_post (through _readability_scores) picks them up
+    new_scores = _readability_scores_batch(
+        text for text in texts
+        if text and text not in _readability_cache and len(text.split()) >= MIN_READABILITY_WORDS
+    )
+    for text, scores in new_scores.items():
+        _remember_readability(text, scores)
+    return [_assessor.analyze_post(text) for text in texts]
+
+
+def _iter_posts(json_file_path):
     """
-    Analyze every post in a JSON file and return results.
+    Yield the posts in a JSON file one at a time.
+    
+    With ijson installed the file is read bit by bit, so the whole dataset
+    never has to fit in memory; otherwise it is loaded in one go.
+    """
+    if ijson is None:
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)  # Parse JSON into Python data structure
+        return
+    
+    with open(json_file_path, 'rb') as f:
+        # use_float keeps numbers as plain floats instead of Decimal
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+def _post_info(post):
+    """The post details kept next to its QualityResult; see POST_INFO_FIELDS"""
+    # Extract the text content and author information
+    text = post.get('text', '')  # get('text', '') means "get 'text', or '' if missing"
+    author = post.get('author', {})
+    
+    # A tuple, not another dictionary
+    return (
+        # Author information
+        f"{author.get('first_name', '')} {author.get('last_name', '')}".strip(),
+        author.get('username', ''),
+        post.get('url', ''),
+        
+        # Text preview (first 100 characters) and length
+        text[:100] + '...' if len(text) > 100 else text,
+        len(text.split())
+    )
+
+
+def iter_analyzed_posts(json_file_path, chunk_size=64):
+    """
+    Analyze every post in a JSON file, yielding results one at a time.
     
-    This function:
-    1. Loads the JSON file containing LinkedIn posts
-    2. Creates a QualityAssessor object
-    3. Runs analysis on each post
-    4. Returns a list of results
+    Posts are read as a stream and handed out in chunks to one worker process
+    per CPU core (or analyzed in this process if there is only one core). Only
+    a few chunks are in flight at once, so memory use stays flat no matter how
+    big the file is. Results come out in the file's order.
     
     Parameters:
         json_file_path (string): Path to the JSON file
+        chunk_size (int): How many posts each worker analyzes per task
         
-    Returns:
-        List of dictionaries, one per post, with scores and metadata
+    Yields:
+        One (post info, QualityResult) pair per post; the post info tuple holds
+        the fields named in POST_INFO_FIELDS
     """
+    workers = os.cpu_count() or 1
+    posts = _iter_posts(json_file_path)
     
-    # Create a new QualityAssessor object
-    assessor = QualityAssessor()
-    
-    # Open and read the JSON file
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        posts = json.load(f)  # Parse JSON into Python data structure
+    def next_chunk():
+        """
+        The next chunk's post info tuples and texts. Only these are kept, so a
+        post's full record (comments, media and all) is dropped as soon as it
+        has been read instead of waiting in the queue for its analysis
+        """
+        chunk = list(islice(posts, chunk_size))
+        return [_post_info(post) for post in chunk], [post.get('text', '') for post in chunk]
     
-    # Create an empty list to store results
-    results = []
+    if workers == 1:
+        # With a single core, a worker process would only add the cost of sending
+        # every chunk and result between processes - analyze right here instead
+        _init_worker()
+        while True:
+            infos, texts = next_chunk()
+            if not infos:
+                break
+            yield from zip(infos, _analyze_texts(texts))
+        return
     
-    # Loop through each post in the data
-    for post in posts:
-        # Extract the text content
-        text = post.get('text', '')  # get('text', '') means "get 'text', or '' if missing"
-        
-        # Extract author information
-        author = post.get('author', {})
-        
-        # Analyze this post
-        analysis = assessor.analyze_post(text)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        pending = deque()  # (chunk's post info, future for its analyses), oldest first
         
-        # Combine the analysis with post metadata
-        results.append({
-            # Author information
-            'author_name': f"{author.get('first_name', '')} {author.get('last_name', '')}".strip(),
-            'username': author.get('username', ''),
-            'post_url': post.get('url', ''),
+        while True:
+            infos, texts = next_chunk()
+            if infos:
+                pending.append((infos, executor.submit(_analyze_texts, texts)))
             
-            # Text preview (first 100 characters)
-            'text_preview': text[:100] + '...' if len(text) > 100 else text,
-            'word_count': len(text.split()),
-            
-            # Spread all analysis results into this dictionary
-            **analysis  # The ** operator unpacks the analysis dictionary
-        })
+            # Keep about 2 chunks per core queued; hand back the oldest once it's done
+            if pending and (not infos or len(pending) > 2 * workers):
+                chunk_infos, future = pending.popleft()
+                yield from zip(chunk_infos, future.result())
+            elif not infos:
+                break
+
+
+def analyze_all_posts(json_file_path):
+    """
+    Analyze every post in a JSON file and return results.
+    
+    This collects everything from iter_analyzed_posts into a list; use that
+    generator directly to process huge files without holding every result.
     
-    return results
+    Parameters:
+        json_file_path (string): Path to the JSON file
+        
+    Returns:
+        List of (post info, QualityResult) pairs, one per post
+    """
+    return list(iter_analyzed_posts(json_file_path))
 
 
 # MAIN EXECUTION BLOCK
@@ -577,51 +1053,66 @@ if __name__ == "__main__":
     
     # Path to the input data file
     input_file = "/mnt/user-data/uploads/dataset_linkedin-batch-profile-posts-scraper_2025-11-04_02-03-34-812.json"
+    output_file = "/mnt/user-data/outputs/quality_scores_commented.csv"
     
     print("\nAssessing quality of all posts...")
     
-    # Analyze all posts in the file
-    results = analyze_all_posts(input_file)
+    # Define which columns to include in the CSV
+    fieldnames = ['author_name', 'username', 'post_url', 'total_score', 'classification',
+                 'word_count', 'readability', 'structure', 'professionalism',
+                 'grammar_clarity', 'penalties', 'readability_grade']
+    
+    # Where each CSV column lives in (post info + QualityResult fields), so that a
+    # row is one itemgetter call instead of building a dictionary per post
+    result_fields = QualityResult.__slots__
+    get_scores = attrgetter(*result_fields)
+    get_row = itemgetter(*[(POST_INFO_FIELDS + result_fields).index(name) for name in fieldnames])
     
-    # Sort results by score (highest first)
-    results_sorted = sorted(results, key=lambda x: x['total_score'], reverse=True)
+    # Running totals for the summary (no need to keep every result around)
+    post_count = 0
+    score_sum = 0
+    
+    # A 1 MB write buffer means the rows reach the disk in a few large writes
+    # instead of one every 8 KB
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        # Create a CSV writer object
+        writer = csv.writer(f)
+        
+        # Write the header row
+        writer.writerow(fieldnames)
+        
+        def save_and_count(results):
+            """Write each result to the CSV and update the totals as it streams past"""
+            global post_count, score_sum
+            writerow = writer.writerow  # Look the method up once, not once per row
+            for post_info, analysis in results:
+                # Only include the fields we defined above, in that order
+                writerow(get_row(post_info + get_scores(analysis)))
+                post_count += 1
+                score_sum += analysis.total_score
+                yield post_info, analysis
+        
+        # Analyze all posts in the file, keeping only the 10 highest scores
+        # (rows are saved in the same order as the input file)
+        top_10 = heapq.nlargest(10, save_and_count(iter_analyzed_posts(input_file)),
+                                key=lambda x: x[1].total_score)
     
     # Display the top 10 posts
     print("\n🏆 TOP 10 POSTS BY QUALITY:")
     print("-" * 80)
-    for i, result in enumerate(results_sorted[:10], 1):
-        print(f"\n{i}. {result['author_name']} (@{result['username']})")
-        print(f"   Score: {result['total_score']}/100 - {result['classification']}")
-        print(f"   Readability: {result['readability_grade']}")
-        print(f"   Breakdown: Readability={result['readability']}, "
-              f"Structure={result['structure']}, Professional={result['professionalism']}, "
-              f"Grammar={result['grammar_clarity']}")
-        print(f"   Preview: {result['text_preview']}")
+    for i, (post_info, result) in enumerate(top_10, 1):
+        author_name, username, post_url, text_preview, word_count = post_info
+        print(f"\n{i}. {author_name} (@{username})")
+        print(f"   Score: {result.total_score}/100 - {result.classification}")
+        print(f"   Readability: {result.readability_grade}")
+        print(f"   Breakdown: Readability={result.readability}, "
+              f"Structure={result.structure}, Professional={result.professionalism}, "
+              f"Grammar={result.grammar_clarity}")
+        print(f"   Preview: {text_preview}")
     
     # Print summary statistics
     print("\n\n✅ Quality assessment complete!")
-    print(f"📊 Analyzed {len(results)} posts")
-    print(f"📈 Average quality score: {sum(r['total_score'] for r in results) / len(results):.2f}/100")
-    
-    # Save results to CSV file
-    import csv
-    output_file = "/mnt/user-data/outputs/quality_scores_commented.csv"
-    
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        # Define which columns to include in the CSV
-        fieldnames = ['author_name', 'username', 'post_url', 'total_score', 'classification',
-                     'word_count', 'readability', 'structure', 'professionalism',
-                     'grammar_clarity', 'penalties', 'readability_grade']
-        
-        # Create a CSV writer object
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        
-        # Write the header row
-        writer.writeheader()
-        
-        # Write each result as a row
-        for result in results_sorted:
-            # Only include the fields we defined above
-            writer.writerow({k: v for k, v in result.items() if k in fieldnames})
+    print(f"📊 Analyzed {post_count} posts")
+    print(f"📈 Average quality score: {score_sum / post_count:.2f}/100")
     
-    print(f"💾 Results saved to: {output_file}")
\ No newline at end of file
+    print(f"💾 Results saved to: {output_file}")
@@ -15,9 +15,62 @@ Think of it like the difference between:
 """
 
 import json  # For reading JSON files (our LinkedIn data)
+import os    # For finding out how many CPU cores we have
 import re    # For pattern matching in text
-from collections import Counter  # For counting things efficiently
-import textstat  # Library for readability calculations (not heavily used here)
+from bisect import bisect_right  # For looking up which band a score falls in
+from collections import Counter, defaultdict  # For counting and grouping things efficiently
+from concurrent.futures import ProcessPoolExecutor  # Runs work on several CPU cores
+from itertools import chain, islice  # For joining result lists / stopping a search early
+
+try:
+    import ahocorasick  # Optional: finds many keywords in one pass over the text
+except ImportError:
+    ahocorasick = None
+
+try:
+    import ijson  # Optional: reads huge JSON files one post at a time
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: much faster JSON parser for large scrapes
+except ImportError:
+    orjson = None
+
+
+# Substance classification bands: a score at or above each threshold moves up one label
+_BAND_THRESHOLDS = [35, 50, 65, 80]
+_BAND_LABELS = ["Minimal Substance", "Low Substance", "Moderate Substance", "High Substance", "Exceptional Substance"]
+
+
+def _group_keywords(keywords):
+    """
+    Group (phrase, category) pairs by phrase.
+    
+    A phrase can belong to several categories (e.g. "learned" is both an insight
+    and an experience word), so each phrase is kept once with all of its
+    categories and only has to be searched for once: [(phrase, (category, ...)), ...]
+    """
+    categories = defaultdict(list)
+    for phrase, category in keywords:
+        categories[phrase].append(category)
+    return [(phrase, tuple(phrase_categories)) for phrase, phrase_categories in categories.items()]
+
+
+def _build_automaton(keyword_groups):
+    """
+    Build an Aho-Corasick automaton over grouped keywords, if pyahocorasick is
+    installed. The value for a hit is (phrase, (category, ...)).
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for phrase, categories in keyword_groups:
+        automaton.add_word(phrase, (phrase, categories))
+    automaton.make_automaton()
+    return automaton
+
 
 class SubstanceDetector:
     """
@@ -30,6 +83,51 @@ class SubstanceDetector:
     - Go deep rather than staying surface-level
     """
     
+    # SPECIFIC EXAMPLES OR CASE STUDIES
+    # These phrases indicate the author is sharing concrete experiences
+    # rather than abstract theory
+    example_patterns = (
+        r'for example',  # Introducing a specific case
+        r'for instance', # Another way to introduce examples
+        r'case study',   # Formal example discussion
+        r'i worked',     # Personal experience
+        r'we built',     # Hands-on involvement
+        r'i led',        # Leadership experience
+        r'i managed'     # Management experience
+    )
+    
+    # CONCLUSION WORDS
+    # Phrases that mark a takeaway or call-to-action in the last paragraph
+    # (kept here so the tuple is built once, not again for every post)
+    conclusion_words = (
+        'in conclusion',  # Formal closing
+        'summary',        # Recap
+        'bottom line',    # Key point
+        'key takeaway',   # Main lesson
+        'p.s.'           # Additional note/CTA
+    )
+    
+    # COMMON LINKEDIN EMOJIS
+    # Each character here is counted separately - including the invisible
+    # "emoji style" marker (U+FE0F) that follows the ⚡
+    linkedin_emojis = '🔥💪👇✨🚀💯🎯⚡️📈'
+    
+    # PRECOMPILED PATTERNS
+    # Compiling a regex turns the pattern text into a matching machine.
+    # Doing it once here (instead of on every post) saves that work each time
+    _sentence_re = re.compile(r'[^.!?\s][^.!?]*')                    # A sentence (not just spaces)
+    # Numbers, 40%, $2M. The (?=[\d$]) in front lets re skip straight past any
+    # character that isn't a digit or $ before trying the rest of the pattern
+    _number_re = re.compile(r'(?=[\d$])(?:\b\d+[%$]?\b|\$\d+)')
+    _num_list_re = re.compile(r'\n\d+\.')                            # Numbered list start
+    _num_item_re = re.compile(r'\n\d+[\.\)]\s')                      # Numbered list items
+    # ALL CAPS HEADERS: - 10+ capital letters/spaces followed by a colon.
+    # Written as "find a colon, then look back at the 10 characters before it"
+    # (a run of 10+ ends in 10 such characters, so it's the same test). re can
+    # jump from colon to colon, instead of re-reading every run of capitals
+    # from each starting letter, which gets very slow on long capital runs
+    _header_re = re.compile(r':(?<=[A-Z\s]{10}:)')
+    
     def __init__(self):
         """
         Initialize the detector by setting up all the patterns we'll look for.
@@ -78,6 +176,29 @@ class SubstanceDetector:
             'repost if'         # Asking for shares without earning them
         ]
         
+        # PERSONAL EXPERIENCE SIGNALS
+        # Posts that share learning show depth of thought
+        self.experience_words = ['learned', 'discovered', 'realized', 'found out', 'experience']
+        
+        # ONE-PASS KEYWORD MATCHING
+        # Every value indicator, shallow indicator, experience word and example
+        # pattern (plus the words "problem" and "solution") is looked up together,
+        # so the text is scanned once instead of once per keyword
+        self._keywords = _group_keywords(
+            [(keyword, category)
+             for category, keywords in self.value_indicators.items()
+             for keyword in keywords] +
+            [(phrase, 'shallow') for phrase in self.shallow_indicators] +
+            [(word, 'experience') for word in self.experience_words] +
+            [(pattern, 'concrete_example') for pattern in self.example_patterns] +
+            [('problem', 'problem'), ('solution', 'solution')]
+        )
+        self._automaton = _build_automaton(self._keywords)
+        
+        # The value categories as a set, so the scorer can check a category
+        # without walking the value_indicators dictionary
+        self._value_categories = frozenset(self.value_indicators)
+        
     def analyze_post(self, text):
         """
         This is the MAIN function that analyzes a single post for substance.
@@ -96,36 +217,45 @@ class SubstanceDetector:
             text (string): The LinkedIn post content
             
         Returns:
-            Dictionary with total score and component breakdowns
+            Dictionary with total score, component breakdowns and word count
         """
         
         # STEP 1: Validate post length
         # Posts under 50 characters can't have much substance
         if not text or len(text.strip()) < 50:
-            return self._create_result(0, "Too short")
+            return self._create_result(0, "Too short", len(text.split()) if text else 0)
         
         # Convert to lowercase for easier matching
         # This way "Framework" and "framework" are treated the same
         text_lower = text.lower()
         
+        # Split into words once for every check that needs them
+        # (lowercasing never moves the spaces, so these are the words of
+        # text_lower too)
+        words = text.split()
+        word_count = len(words)
+        
         # STEP 2: Calculate the 4 component scores
         # Each function focuses on a different aspect of substance
         
-        info_density = self._score_information_density(text, text_lower)
+        keyword_counts = self._count_keywords(text_lower)
+        # ^ How many value, shallow, experience, example and problem/solution keywords appear (one scan)
+        
+        info_density = self._score_information_density(text, word_count)
         # ^ How much information is packed into this post?
         
-        depth_score = self._score_depth(text, text_lower)
+        depth_score = self._score_depth(text, words, keyword_counts)
         # ^ Does it go deep or stay surface-level?
         
-        value_score = self._score_value_indicators(text_lower)
+        value_score = self._score_value_indicators(keyword_counts)
         # ^ Does it contain valuable elements (data, frameworks, examples)?
         
-        structure_score = self._score_structure(text)
+        structure_score = self._score_structure(text, text_lower)
         # ^ Is it well-organized and easy to follow?
         
         # STEP 3: Calculate penalties
         # Deduct points for shallow tactics and engagement bait
-        penalties = self._calculate_penalties(text_lower)
+        penalties = self._calculate_penalties(text_lower, word_count, keyword_counts)
         
         # STEP 4: Calculate total score
         # Add positives, subtract penalties, ensure we don't go below 0
@@ -135,17 +265,40 @@ class SubstanceDetector:
         normalized_score = min(100, total_score)
         
         # STEP 5: Return all results
+        # Only depth (0.3 points per long word) and the total can end up with
+        # more than two decimals - the other parts are whole numbers or steps
+        # of 0.5, which round() would hand back unchanged, so we skip it there
         return {
             'total_score': round(normalized_score, 2),           # Main score out of 100
-            'information_density': round(info_density, 2),       # Component 1
+            'information_density': info_density,                 # Component 1
             'depth_score': round(depth_score, 2),                # Component 2
-            'value_indicators': round(value_score, 2),           # Component 3
-            'structure_score': round(structure_score, 2),        # Component 4
-            'penalties': round(penalties, 2),                    # Points deducted
-            'classification': self._classify_substance(normalized_score)  # Text label
+            'value_indicators': value_score,                     # Component 3
+            'structure_score': structure_score,                  # Component 4
+            'penalties': penalties,                              # Points deducted
+            'classification': self._classify_substance(normalized_score),  # Text label
+            'word_count': word_count                             # Words in the post (split once, above)
         }
     
-    def _score_information_density(self, text, text_lower):
+    def _count_keywords(self, text_lower):
+        """
+        Count how many different keywords from each category appear in the text.
+        
+        Each keyword counts once no matter how often it is repeated (and once
+        for every category it belongs to), e.g. {'data': 2, 'shallow': 1}
+        """
+        if self._automaton is not None:
+            # Aho-Corasick reports every keyword hit in a single pass over the text;
+            # the set keeps each keyword once however often it was repeated
+            found = {value for _, value in self._automaton.iter(text_lower)}
+            return Counter(category for _, categories in found for category in categories)
+        
+        # Without pyahocorasick, check each phrase once (a phrase shared by
+        # several categories is still only searched for a single time)
+        return Counter(category
+                       for phrase, categories in self._keywords if phrase in text_lower
+                       for category in categories)
+    
+    def _score_information_density(self, text, word_count):
         """
         INFORMATION DENSITY SCORING (0-30 points possible)
         
@@ -165,7 +318,7 @@ class SubstanceDetector:
         # WORD COUNT
         # Longer posts have MORE POTENTIAL for substance
         # But length alone doesn't guarantee quality (hence other checks)
-        words = len(text.split())
+        words = word_count
         
         if words > 500:
             score += 10  # Very long - lots of room for depth
@@ -183,16 +336,19 @@ class SubstanceDetector:
         # - Not too complex (becomes unreadable)
         # - The "sweet spot" is 15-25 words per sentence
         
-        # Split text into sentences (breaking on . ! or ?)
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-        
-        if sentences:  # Make sure we have at least one sentence
-            # Calculate average words per sentence
-            avg_words_per_sentence = words / len(sentences)
-            
-            if 15 <= avg_words_per_sentence <= 25:
+        # Count the sentences (pieces of text between . ! or ?)
+        # Only the number is needed, so instead of splitting the text and
+        # stripping every piece, one regex finds each piece that contains
+        # something other than spaces - the same pieces the split would keep
+        n = len(self._sentence_re.findall(text))
+        
+        if n:  # Make sure we have at least one sentence
+            # Check the average words per sentence (words / sentences) without
+            # dividing: 15 <= words / n <= 25 is the same as 15n <= words <= 25n,
+            # which is exact whole-number math
+            if 15 * n <= words <= 25 * n:
                 score += 8  # Perfect complexity - full points
-            elif 10 <= avg_words_per_sentence < 15:
+            elif 10 * n <= words < 15 * n:
                 score += 5  # A bit simple but okay
             # Below 10 or above 25 gets 0 points
         
@@ -200,12 +356,14 @@ class SubstanceDetector:
         # Posts with data are more substantive than vague claims
         # Examples: "40%", "$2M", "150 customers", "3x increase"
         
-        # Find all numbers, including those with % or $
-        numbers = re.findall(r'\b\d+[%$]?\b|\$\d+', text)
+        # Find the numbers, including those with % or $
+        # 5 numbers already reach the 7 point cap below, so islice stops the
+        # search after the 5th instead of collecting every number in the post
+        numbers = sum(1 for _ in islice(self._number_re.finditer(text), 5))
         
         # Award 1.5 points per number found, up to 7 points max
         # This rewards data-driven content
-        score += min(7, len(numbers) * 1.5)
+        score += min(7, numbers * 1.5)
         
         # PUNCTUATION VARIETY (Lists and Structure)
         # Well-organized posts often use:
@@ -215,7 +373,7 @@ class SubstanceDetector:
         
         has_lists = (
             '•' in text or                          # Bullet points
-            re.search(r'\n\d+\.', text) or         # Numbered list
+            self._num_list_re.search(text) or       # Numbered list
             text.count('\n-') > 2                   # Multiple dashed items
         )
         
@@ -225,7 +383,7 @@ class SubstanceDetector:
         # Cap at 30 points for this section
         return min(30, score)
     
-    def _score_depth(self, text, text_lower):
+    def _score_depth(self, text, words, keyword_counts):
         """
         DEPTH SCORING (0-25 points possible)
         
@@ -246,45 +404,32 @@ class SubstanceDetector:
         score = 0  # Start at 0 and add points
         
         # SPECIFIC EXAMPLES OR CASE STUDIES
-        # These phrases indicate the author is sharing concrete experiences
-        # rather than abstract theory
-        example_patterns = [
-            r'for example',  # Introducing a specific case
-            r'for instance', # Another way to introduce examples
-            r'case study',   # Formal example discussion
-            r'i worked',     # Personal experience
-            r'we built',     # Hands-on involvement
-            r'i led',        # Leadership experience
-            r'i managed'     # Management experience
-        ]
-        
-        # Check if ANY of these patterns appear
-        # We only award points once (not for each pattern)
-        for pattern in example_patterns:
-            if re.search(pattern, text_lower):
-                score += 3  # Has at least one concrete example
-                break       # Stop checking after first match
+        # Check if ANY of the example patterns (listed at the top of the class) appear
+        # We only award points once (not for each pattern); they're plain phrases,
+        # so the one-pass keyword scan has already looked for all of them
+        if keyword_counts['concrete_example']:
+            score += 3  # Has at least one concrete example
         
         # PERSONAL EXPERIENCE SIGNALS
         # Posts that share learning show depth of thought
-        experience_words = ['learned', 'discovered', 'realized', 'found out', 'experience']
-        
-        # Count how many of these words appear
+        # Count how many of the experience words (see __init__) appear
         # Award 2 points per word, up to 5 points max
-        score += min(5, sum(2 for word in experience_words if word in text_lower))
+        score += min(5, 2 * keyword_counts['experience'])
         
         # PROBLEM-SOLUTION STRUCTURE
         # Posts that identify a problem AND offer a solution show deeper thinking
         # This is better than just complaining OR just suggesting solutions
-        if 'problem' in text_lower and 'solution' in text_lower:
+        # (both words were looked for by the one-pass keyword scan)
+        if keyword_counts['problem'] and keyword_counts['solution']:
             score += 4  # Has both problem and solution
         
         # MULTI-STEP EXPLANATIONS
         # Numbered lists with multiple points indicate structured thinking
         # Example: "1. First step\n2. Second step\n3. Third step"
         
-        # Find all numbered list items (matches "1. " or "1) ")
-        numbered_items = len(re.findall(r'\n\d+[\.\)]\s', text))
+        # Find the numbered list items (matches "1. " or "1) ")
+        # (6 items already reach the 8 point cap below, so we stop counting there)
+        numbered_items = sum(1 for _ in islice(self._num_item_re.finditer(text), 6))
         
         # Award 1.5 points per numbered item, up to 8 points max
         # More steps = more thorough explanation
@@ -295,7 +440,7 @@ class SubstanceDetector:
         # We use word length as a proxy (longer words = more specific/technical)
         
         # Find all words longer than 10 characters
-        long_words = [w for w in text.split() if len(w) > 10]
+        long_words = [w for w in words if len(w) > 10]
         
         # Award 0.3 points per long word, up to 5 points max
         score += min(5, len(long_words) * 0.3)
@@ -303,7 +448,7 @@ class SubstanceDetector:
         # Cap at 25 points for this section
         return min(25, score)
     
-    def _score_value_indicators(self, text_lower):
+    def _score_value_indicators(self, keyword_counts):
         """
         VALUE INDICATORS SCORING (0-25 points possible)
         
@@ -322,13 +467,13 @@ class SubstanceDetector:
         """
         score = 0  # Start at 0 and add points
         
-        # Loop through each category of value indicators
-        for category, keywords in self.value_indicators.items():
-            # For this category, count how many keywords appear
-            # Example: If category is 'data', check for 'statistics', 'study', etc.
-            found = sum(1 for keyword in keywords if keyword in text_lower)
-            
-            if found > 0:
+        # Loop through the categories the one-pass keyword scan actually found
+        # (keyword_counts only holds categories with at least one keyword present)
+        # Example: 'data' is there if 'statistics', 'study', etc. appeared
+        # Every award is a multiple of 0.5, which floats add exactly, so the
+        # order the categories come in doesn't change the total
+        for category, found in keyword_counts.items():
+            if category in self._value_categories:
                 # This category has at least one keyword present
                 # Award up to 4 points per category (1.5 points per keyword found)
                 score += min(4, found * 1.5)
@@ -336,7 +481,7 @@ class SubstanceDetector:
         # Cap at 25 points for this section
         return min(25, score)
     
-    def _score_structure(self, text):
+    def _score_structure(self, text, text_lower):
         """
         STRUCTURE SCORING (0-20 points possible)
         
@@ -355,11 +500,27 @@ class SubstanceDetector:
         # CLEAR SECTIONS (PARAGRAPHS)
         # Breaking content into paragraphs makes it easier to digest
         # We look for double line breaks (\n\n) which indicate new paragraphs
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        # (found in the lowercase text, which has the same paragraphs, so the
+        # last one is ready for the conclusion check below)
+        #
+        # We only need to know if there are 1, 2 or 3+ paragraphs, so instead of
+        # splitting out every paragraph we just find the first and last breaks:
+        # once the ends are trimmed, the text before the first break and after
+        # the last one are always real paragraphs, and there's a third one if
+        # anything but blank lines sits between those two breaks
+        body = text_lower.strip()
+        first_break = body.find('\n\n')
+        if first_break < 0:
+            paragraph_count = 1 if body else 0
+            last_paragraph = body
+        else:
+            last_break = body.rfind('\n\n')
+            paragraph_count = 3 if body[first_break + 2:last_break].strip() else 2
+            last_paragraph = body[last_break + 2:].strip()
         
-        if len(paragraphs) >= 3:
+        if paragraph_count >= 3:
             score += 5  # Multiple sections = well-organized
-        elif len(paragraphs) >= 2:
+        elif paragraph_count >= 2:
             score += 3  # At least some structure
         # Single paragraph gets 0 points (wall of text)
         
@@ -367,25 +528,18 @@ class SubstanceDetector:
         # The first line should grab attention without being too long
         # Too short (<20 chars) = incomplete
         # Too long (>150 chars) = loses impact
-        first_line = text.split('\n')[0]
+        # Only its length matters, and that's just the position of the first
+        # line break (or the whole text if there isn't one), so no copy is made
+        first_break = text.find('\n')
+        first_line_length = first_break if first_break >= 0 else len(text)
         
-        if len(first_line) < 150 and len(first_line) > 20:
+        if first_line_length < 150 and first_line_length > 20:
             score += 3  # Good opening hook
         
         # CONCLUSION/SUMMARY
         # Strong posts often end with a takeaway or call-to-action
-        # Check if the last paragraph contains conclusion words
-        last_paragraph = paragraphs[-1] if paragraphs else ""
-        
-        conclusion_words = [
-            'in conclusion',  # Formal closing
-            'summary',        # Recap
-            'bottom line',    # Key point
-            'key takeaway',   # Main lesson
-            'p.s.'           # Additional note/CTA
-        ]
-        
-        if any(word in last_paragraph.lower() for word in conclusion_words):
+        # Check if the last paragraph (found above) contains conclusion words
+        if any(word in last_paragraph for word in self.conclusion_words):
             score += 4  # Has a proper conclusion
         
         # PROPER FORMATTING (Not a Wall of Text)
@@ -398,17 +552,22 @@ class SubstanceDetector:
         # - ALL CAPS HEADERS: "THE PROBLEM:"
         # - Em-dashes separating sections: "—"
         
-        # Pattern: 10+ capital letters/spaces followed by colon
-        has_headers = re.search(r'[A-Z\s]{10,}:', text)
+        # The em-dash count is a fast built-in search, so it goes first: if it
+        # already finds section markers, the header regex doesn't need to run
         has_dashes = text.count('—') > 2
         
+        # Pattern: 10+ capital letters/spaces followed by colon
+        # (the regex only stops at colons, so posts without one are ruled out
+        # by a fast scan)
+        has_headers = not has_dashes and self._header_re.search(text)
+        
         if has_headers or has_dashes:
             score += 5  # Has clear section markers
         
         # Cap at 20 points for this section
         return min(20, score)
     
-    def _calculate_penalties(self, text_lower):
+    def _calculate_penalties(self, text_lower, word_count, keyword_counts):
         """
         PENALTIES (0-15 points deducted)
         
@@ -425,15 +584,17 @@ class SubstanceDetector:
         # These phrases are designed to get clicks/comments without adding value
         # Examples: "Agree?", "Thoughts?", "Tag someone who needs this"
         
-        # Check if any shallow indicators appear in the text
-        for indicator in self.shallow_indicators:
-            if indicator in text_lower:
-                penalty += 3  # Penalize each instance of engagement bait
+        # Check how many shallow indicators appear in the text
+        # (found by the one-pass keyword scan)
+        penalty += 3 * keyword_counts['shallow']  # Penalize each instance of engagement bait
         
         # EXCESSIVE EMOJIS
         # A few emojis add personality; too many replace substance
-        # We check for common LinkedIn emojis
-        emoji_count = len(re.findall(r'[🔥💪👇✨🚀💯🎯⚡️📈]', text_lower))
+        # We check for common LinkedIn emojis (listed at the top of the class)
+        # (plain-ASCII posts can't contain any, and isascii() answers that instantly)
+        # str.count is a fast built-in search, so counting each emoji with it
+        # beats running a regex over the text
+        emoji_count = 0 if text_lower.isascii() else sum(map(text_lower.count, self.linkedin_emojis))
         
         if emoji_count > 10:
             penalty += 5  # Way too many - heavy penalty
@@ -444,8 +605,6 @@ class SubstanceDetector:
         # TOO SHORT FOR CLAIMED DEPTH
         # If a post is under 100 words, it can't really be substantive
         # (This is different from the 50-character minimum for analysis)
-        word_count = len(text_lower.split())
-        
         if word_count < 100:
             penalty += 5  # Can't have much substance in <100 words
         
@@ -463,23 +622,17 @@ class SubstanceDetector:
         - 35-49: Low (mostly surface-level)
         - <35: Minimal (fluff, engagement bait, platitudes)
         """
-        if score >= 80:
-            return "Exceptional Substance"
-        elif score >= 65:
-            return "High Substance"
-        elif score >= 50:
-            return "Moderate Substance"
-        elif score >= 35:
-            return "Low Substance"
-        else:
-            return "Minimal Substance"
+        # bisect_right counts how many thresholds the score has reached,
+        # which is exactly the position of its label in _BAND_LABELS
+        return _BAND_LABELS[bisect_right(_BAND_THRESHOLDS, score)]
     
-    def _create_result(self, score, reason):
+    def _create_result(self, score, reason, word_count=0):
         """
         Helper function to create a result dictionary with default values.
         
         This is used when a post is too short to analyze properly.
-        Returns a properly formatted result with zeros for all components.
+        Returns a properly formatted result with zeros for all components
+        (word_count is passed through, since a short post still has words).
         """
         return {
             'total_score': score,
@@ -488,58 +641,122 @@ class SubstanceDetector:
             'value_indicators': 0,
             'structure_score': 0,
             'penalties': 0,
-            'classification': reason
+            'classification': reason,
+            'word_count': word_count
         }
 
 
-def analyze_all_posts(json_file_path):
+# Each worker process builds its own SubstanceDetector once (see _init_worker)
+_detector = None
+
+
+def _init_worker():
+    """Create the detector once per worker process instead of pickling it per task"""
+    global _detector
+    _detector = SubstanceDetector()
+
+
+def _analyze_texts(texts):
+    """Analyze one chunk of post texts inside a worker process"""
+    return [_detector.analyze_post(text) for text in texts]
+
+
+def _iter_posts(json_file_path):
+    """
+    Yield the posts in a JSON file one at a time.
+    
+    With ijson installed the file is read bit by bit, so the whole dataset
+    never has to fit in memory; otherwise it is loaded in one go (with the
+    faster orjson parser when that's installed).
+    """
+    if ijson is not None:
+        with open(json_file_path, 'rb') as f:
+            # use_float keeps numbers as plain floats instead of Decimal
+            yield from ijson.items(f, 'item', use_float=True)
+    elif orjson is not None:
+        # orjson reads the raw bytes directly (no separate decoding step)
+        with open(json_file_path, 'rb') as f:
+            yield from orjson.loads(f.read())
+    else:
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)  # Parse JSON into Python data
+
+
+def analyze_all_posts(json_file_path, chunk_size=256):
     """
     Analyze every post in a JSON file for substance.
     
     This function:
-    1. Loads the JSON file containing LinkedIn posts
-    2. Creates a SubstanceDetector object
-    3. Analyzes each post
-    4. Returns a list of results with scores and metadata
+    1. Reads the posts from the JSON file (streamed one at a time with ijson)
+    2. Analyzes each distinct post text (duplicates are scored once), in
+       chunks spread over one worker process per CPU core
+    3. Returns a list of results with scores and metadata
     
     Parameters:
         json_file_path (string): Path to the JSON file
+        chunk_size (int): How many texts each worker analyzes per task
         
     Returns:
         List of dictionaries, one per post, with substance scores
     """
     
-    # Create a new SubstanceDetector object
-    detector = SubstanceDetector()
+    # Read the posts one at a time, keeping only the details the results need
+    # (author, username, URL and text) instead of every full post with all of
+    # its stats and media
+    post_details = []
+    texts = []
+    for post in _iter_posts(json_file_path):
+        author = post.get('author', {})
+        post_details.append((
+            f"{author.get('first_name', '')} {author.get('last_name', '')}".strip(),
+            author.get('username', ''),
+            post.get('url', '')
+        ))
+        texts.append(post.get('text', ''))
+    
+    # Analyze each distinct text once for the whole batch
+    # Reposts and copy-pasted posts share the same text, so there's no need to
+    # score them again (dict.fromkeys keeps the first copy of each text)
+    distinct_texts = list(dict.fromkeys(texts))
+    
+    workers = os.cpu_count() or 1
+    if workers == 1:
+        # With a single core, a worker process would only add the cost of sending
+        # every chunk and result between processes - analyze right here instead
+        _init_worker()
+        distinct_analyses = _analyze_texts(distinct_texts)
+    else:
+        # Each post is scored on its own, so chunks of texts can go to different
+        # cores at the same time; map hands the results back in the same order
+        # (on smaller batches the chunks are shrunk so every core gets a share,
+        # instead of a few full chunks leaving the other cores idle)
+        per_worker = (len(distinct_texts) + workers - 1) // workers  # Texts per core, rounded up
+        chunk_size = max(1, min(chunk_size, per_worker))
+        chunks = [distinct_texts[i:i + chunk_size] for i in range(0, len(distinct_texts), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            distinct_analyses = list(chain.from_iterable(executor.map(_analyze_texts, chunks)))
     
-    # Open and read the JSON file
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        posts = json.load(f)  # Parse JSON into Python data
+    analyses = dict(zip(distinct_texts, distinct_analyses))
     
     # Create an empty list to store results
     results = []
     
-    # Loop through each post and analyze it
-    for post in posts:
-        # Extract the text content
-        text = post.get('text', '')
-        
-        # Extract author information
-        author = post.get('author', {})
-        
-        # Analyze this post's substance
-        analysis = detector.analyze_post(text)
+    # Loop through each post and attach its analysis
+    for (author_name, username, post_url), text in zip(post_details, texts):
+        # Look up this post's substance analysis
+        analysis = analyses[text]
         
         # Combine analysis with post metadata
         results.append({
             # Author information
-            'author_name': f"{author.get('first_name', '')} {author.get('last_name', '')}".strip(),
-            'username': author.get('username', ''),
-            'post_url': post.get('url', ''),
+            'author_name': author_name,
+            'username': username,
+            'post_url': post_url,
             
             # Text preview (first 100 characters)
             'text_preview': text[:100] + '...' if len(text) > 100 else text,
-            'word_count': len(text.split()),
+            # (analyze_post already split the text into words, so reuse its count)
+            'word_count': analysis['word_count'],
             
             # Spread all analysis results into this dictionary
             **analysis  # The ** operator unpacks the dictionary
@@ -563,12 +780,14 @@ if __name__ == "__main__":
     results = analyze_all_posts(input_file)
     
     # Sort results by score (highest first)
-    results_sorted = sorted(results, key=lambda x: x['total_score'], reverse=True)
+    # Sorting in place reorders the list we already have instead of building
+    # a second full copy of it (ties keep their original order either way)
+    results.sort(key=lambda x: x['total_score'], reverse=True)
     
     # Display top 10 posts
     print("\n🏆 TOP 10 POSTS BY SUBSTANCE:")
     print("-" * 80)
-    for i, result in enumerate(results_sorted[:10], 1):
+    for i, result in enumerate(results[:10], 1):
         print(f"\n{i}. {result['author_name']} (@{result['username']})")
         print(f"   Score: {result['total_score']}/100 - {result['classification']}")
         print(f"   Words: {result['word_count']}")
@@ -584,6 +803,7 @@ if __name__ == "__main__":
     
     # Save results to CSV
     import csv
+    from operator import itemgetter
     output_file = "/mnt/user-data/outputs/substance_scores_commented.csv"
     
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
@@ -593,13 +813,14 @@ if __name__ == "__main__":
                      'structure_score', 'penalties']
         
         # Create CSV writer
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.writer(f)
         
         # Write header row
-        writer.writeheader()
+        writer.writerow(fieldnames)
         
         # Write each result as a row
-        for result in results_sorted:
-            writer.writerow({k: v for k, v in result.items() if k in fieldnames})
+        # itemgetter picks out just our columns, in order, so no filtered
+        # dictionary has to be built for every post
+        writer.writerows(map(itemgetter(*fieldnames), results))
     
     print(f"💾 Results saved to: {output_file}")
\ No newline at end of file
@@ -706,8 +706,13 @@ if __name__ == "__main__":
     # Analyze all posts
     results = analyze_all_posts(input_file)
     
-    # Sort by score (highest first)
-    results_sorted = sorted(results, key=lambda x: x['total_score'], reverse=True)
+    # Pull the scores out into one NumPy array (a column) so sorting and
+    # averaging work on plain numbers instead of looking inside every dictionary
+    scores = np.array([result['total_score'] for result in results], dtype=np.float64)
+    
+    # Sort by score (highest first); a stable sort keeps tied posts in file order
+    order = np.argsort(-scores, kind='stable')
+    results_sorted = [results[i] for i in order]
     
     # Display top 10 most unique posts
     print("\n🏆 TOP 10 MOST UNIQUE POSTS:")
@@ -723,10 +728,11 @@ if __name__ == "__main__":
     # Print summary statistics
     print("\n\n✅ Uniqueness detection complete!")
     print(f"📊 Analyzed {len(results)} posts")
-    print(f"📈 Average uniqueness score: {sum(r['total_score'] for r in results) / len(results):.2f}/100")
+    print(f"📈 Average uniqueness score: {sum(scores.tolist()) / len(results):.2f}/100")
     
     # Save results to CSV
     import csv
+    from operator import itemgetter
     output_file = "/mnt/user-data/outputs/uniqueness_scores_commented.csv"
     
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
@@ -736,13 +742,14 @@ if __name__ == "__main__":
                      'uniqueness_vs_corpus', 'penalties']
         
         # Create CSV writer
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.writer(f)
         
         # Write header
-        writer.writeheader()
+        writer.writerow(fieldnames)
         
         # Write each result as a row
-        for result in results_sorted:
-            writer.writerow({k: v for k, v in result.items() if k in fieldnames})
+        # itemgetter picks out just our columns, in order, so no filtered
+        # dictionary has to be built for every post
+        writer.writerows(map(itemgetter(*fieldnames), results_sorted))
     
     print(f"💾 Results saved to: {output_file}")
\ No newline at end of file